@@ -0,0 +1,73 @@
+"""Compiled scoring kernels for FeatureMatcher.
+
+numeric_cost_matrix() fills the Hole/Fillet/Chamfer assignment cost matrix
+in a single compiled pass. Numba is optional: when it is not installed,
+NUMBA_AVAILABLE is False and FeatureMatcher uses its NumPy implementation,
+which performs the same arithmetic.
+
+fastmath is deliberately left off: missing values are NaN and must fail
+every tolerance comparison.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _numeric_cost_matrix(
+    c_val, s_val,
+    c_has_depth, c_depth, s_has_depth, s_depth,
+    view_penalty,
+    tol, tol_fail_limit, depth_weight, spatial_weight,
+    tol_fail_cost, no_match_cost,
+):
+    """Composite assignment cost for every callout/SW pair.
+
+    Args:
+        c_val, s_val: Diameter/radius/distance per callout and SW feature (NaN if missing)
+        c_has_depth, s_has_depth: Whether each side has a depth
+        c_depth, s_depth: Depths (ignored where the has-flag is False)
+        view_penalty: [n, m] view penalties from FeatureMatcher._view_penalty_matrix
+        tol: Match tolerance
+        tol_fail_limit: Upper bound of the TOLERANCE_FAIL band (negative: none)
+        depth_weight: Weight of the depth tie-break
+        spatial_weight: Weight of the view penalty
+        tol_fail_cost: Cost offset marking a TOLERANCE_FAIL pair
+        no_match_cost: Cost of an infeasible pair
+
+    Returns:
+        [n, m] float64 cost matrix
+    """
+    n = c_val.shape[0]
+    m = s_val.shape[0]
+    out = np.empty((n, m), dtype=np.float64)
+    for i in range(n):
+        for j in range(m):
+            d = abs(c_val[i] - s_val[j])
+            matched = d <= tol
+            tol_fail = (not matched) and d <= tol_fail_limit
+            if c_has_depth[i] and s_has_depth[j]:
+                score = d + abs(c_depth[i] - s_depth[j]) * depth_weight
+            else:
+                score = d + 0.0
+            score = score + view_penalty[i, j] * spatial_weight
+            if (matched or tol_fail) and np.isfinite(score):
+                out[i, j] = score + tol_fail_cost if tol_fail else score
+            else:
+                out[i, j] = no_match_cost
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature: compiled once (and cached on disk) on first import
+    numeric_cost_matrix = njit(
+        "float64[:, :](float64[:], float64[:], boolean[:], float64[:], boolean[:], "
+        "float64[:], float64[:, :], float64, float64, float64, float64, float64, float64)",
+        cache=True,
+    )(_numeric_cost_matrix)
+else:
+    numeric_cost_matrix = None
@@ -9,14 +9,42 @@ The DiffResult is the core output of the QC comparison, showing:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import sys
+import time
 
 from .sw_extractor import SwFeatureExtractor, SwFeature
 from .matcher import FeatureMatcher, MatchResult, MatchStatus
 from ..extractors.evidence_merger import DrawingEvidence
 
+# Summary counter key for each match status
+_STATUS_KEY = {
+    MatchStatus.MATCHED: "matched",
+    MatchStatus.MISSING: "missing",
+    MatchStatus.EXTRA: "extra",
+    MatchStatus.TOLERANCE_FAIL: "tolerance_fail",
+}
 
-@dataclass
+# (epoch second, formatted timestamp) of the last compared_at value
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso_z() -> str:
+    """Current time as ISO-8601 + "Z", reformatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.fromtimestamp(now).isoformat() + "Z")
+    return _ts_cache[1]
+
+
+def _intern(value: Any) -> Any:
+    """Intern category/status strings; they repeat across every entry."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class DiffEntry:
     """
     A single entry in the diff result.
@@ -37,20 +65,18 @@ class DiffEntry:
     notes: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        d = {
+        """Convert to dictionary (delta is null when not applicable)."""
+        return {
             "category": self.category,
             "status": self.status,
             "drawingValue": self.drawing_value,
             "swValue": self.sw_value,
             "notes": self.notes,
+            "delta": self.delta,
         }
-        if self.delta is not None:
-            d["delta"] = self.delta
-        return d
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """
     Complete comparison result between drawing and SolidWorks model.
@@ -114,6 +140,7 @@ class DiffResult:
 def compare_drawing(
     evidence: DrawingEvidence,
     sw_data: Optional[Dict[str, Any]],
+    detailed: bool = True,
 ) -> DiffResult:
     """
     Compare drawing evidence against SolidWorks CAD data.
@@ -126,6 +153,8 @@ def compare_drawing(
     Args:
         evidence: DrawingEvidence from extraction pipeline
         sw_data: SolidWorks JSON data (None if not available)
+        detailed: Build per-feature entries. Pass False when only the
+            summary counts and match rate are needed.
 
     Returns:
         DiffResult with comparison details
@@ -140,7 +169,7 @@ def compare_drawing(
     """
     result = DiffResult(
         part_number=evidence.part_number,
-        compared_at=datetime.now().isoformat() + "Z",
+        compared_at=_now_iso_z(),
         drawing_evidence=evidence.to_dict() if evidence else None,
     )
 
@@ -153,10 +182,12 @@ def compare_drawing(
             "extra": len(evidence.found_callouts) if evidence else 0,
             "tolerance_fail": 0,
         }
+        if not detailed:
+            return result
         # All drawing callouts are "extra" since we can't verify them
         for callout in (evidence.found_callouts if evidence else []):
             result.entries.append(DiffEntry(
-                category=callout.get("calloutType", "unknown"),
+                category=_intern(callout.get("calloutType", "unknown")),
                 status="unverified",
                 drawing_value=callout.get("raw", str(callout)),
                 notes="No SolidWorks data available for verification",
@@ -180,17 +211,12 @@ def compare_drawing(
     counts = {"matched": 0, "missing": 0, "extra": 0, "tolerance_fail": 0}
 
     for mr in match_results:
-        entry = _match_result_to_entry(mr)
-        result.entries.append(entry)
-
-        if mr.status == MatchStatus.MATCHED:
-            counts["matched"] += 1
-        elif mr.status == MatchStatus.MISSING:
-            counts["missing"] += 1
-        elif mr.status == MatchStatus.EXTRA:
-            counts["extra"] += 1
-        elif mr.status == MatchStatus.TOLERANCE_FAIL:
-            counts["tolerance_fail"] += 1
+        if detailed:
+            result.entries.append(_match_result_to_entry(mr))
+
+        key = _STATUS_KEY.get(mr.status)
+        if key:
+            counts[key] += 1
 
     result.summary = counts
 
@@ -204,50 +230,79 @@ def compare_drawing(
     return result
 
 
+@lru_cache(maxsize=4096)
+def _fmt_inches4(value: float) -> str:
+    """Format a diameter as inches to 4 places; standard sizes repeat a lot."""
+    return f"{value:.4f}\""
+
+
+@lru_cache(maxsize=4096)
+def _fmt_inches3(value: float) -> str:
+    """Format a radius as R<inches> to 3 places."""
+    return f"R{value:.3f}\""
+
+
+def _fmt_thread(t: Dict[str, Any]) -> str:
+    """Format a metric thread dict as M<dia>x<pitch>."""
+    return f"M{t['nominalDiameterMm']}x{t.get('pitch', '?')}"
+
+
+def _fmt_drawing_default(callout: Dict[str, Any]) -> str:
+    """Build a drawing value from whichever structured field is present."""
+    t = callout.get("thread")
+    if t:
+        if "nominalDiameterMm" in t:
+            return _fmt_thread(t)
+        if "fraction" in t:
+            return f"{t['fraction']}-{t.get('tpi', '?')}"
+        return ""
+    if "diameter" in callout:
+        return _fmt_inches4(callout["diameter"])
+    if "radius" in callout:
+        return _fmt_inches3(callout["radius"])
+    return ""
+
+
+def _fmt_sw_default(feature: SwFeature) -> str:
+    """Format an SW feature from whichever value it carries."""
+    t = feature.thread
+    if t:
+        if "nominalDiameterMm" in t:
+            return _fmt_thread(t)
+        return t.get("raw", "")
+    if feature.diameter_inches:
+        return _fmt_inches4(feature.diameter_inches)
+    if feature.radius_inches:
+        return _fmt_inches3(feature.radius_inches)
+    return ""
+
+
 def _match_result_to_entry(mr: MatchResult) -> DiffEntry:
     """Convert MatchResult to DiffEntry."""
+    dc = mr.drawing_callout
+    sf = mr.sw_feature
+
     # Determine category
-    if mr.drawing_callout:
-        category = mr.drawing_callout.get("calloutType", "unknown")
-    elif mr.sw_feature:
-        category = mr.sw_feature.feature_type
+    if dc:
+        category = dc.get("calloutType", "unknown")
+    elif sf:
+        category = sf.feature_type
     else:
         category = "unknown"
 
-    # Format values
+    # Format values (raw drawing text wins over structured data)
     drawing_val = ""
     sw_val = ""
 
-    if mr.drawing_callout:
-        drawing_val = mr.drawing_callout.get("raw", "")
-        if not drawing_val:
-            # Build from structured data
-            if "thread" in mr.drawing_callout:
-                t = mr.drawing_callout["thread"]
-                if "nominalDiameterMm" in t:
-                    drawing_val = f"M{t['nominalDiameterMm']}x{t.get('pitch', '?')}"
-                elif "fraction" in t:
-                    drawing_val = f"{t['fraction']}-{t.get('tpi', '?')}"
-            elif "diameter" in mr.drawing_callout:
-                drawing_val = f"{mr.drawing_callout['diameter']:.4f}\""
-            elif "radius" in mr.drawing_callout:
-                drawing_val = f"R{mr.drawing_callout['radius']:.3f}\""
-
-    if mr.sw_feature:
-        if mr.sw_feature.thread:
-            t = mr.sw_feature.thread
-            if "nominalDiameterMm" in t:
-                sw_val = f"M{t['nominalDiameterMm']}x{t.get('pitch', '?')}"
-            elif "raw" in t:
-                sw_val = t["raw"]
-        elif mr.sw_feature.diameter_inches:
-            sw_val = f"{mr.sw_feature.diameter_inches:.4f}\""
-        elif mr.sw_feature.radius_inches:
-            sw_val = f"R{mr.sw_feature.radius_inches:.3f}\""
+    if dc:
+        drawing_val = dc.get("raw", "") or _fmt_drawing_default(dc)
+
+    if sf:
+        sw_val = _fmt_sw_default(sf)
 
     return DiffEntry(
-        category=category,
-        status=mr.status.value,
+        category=_intern(category),
+        status=_intern(mr.status.value),
         drawing_value=drawing_val,
         sw_value=sw_val,
         delta=mr.delta,
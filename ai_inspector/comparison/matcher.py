@@ -2,20 +2,120 @@
 
 Matching strategy:
 1. Group features by type (Hole, TappedHole, Fillet, Chamfer)
-2. For each drawing callout, find best matching SW feature
+2. Within each type, find the optimal callout/SW feature assignment
 3. Use tolerances from config for fuzzy matching
 4. Track matched, unmatched, and extra features
 """
 
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
+import math
 import re
 
 from ..config import default_config
 from ..detection.classes import FUTURE_TYPES
 from .sw_extractor import SwFeature
 
+# Assignment costs for _match_by_type. TOLERANCE_FAIL cells are offset by
+# _TOLERANCE_FAIL_COST (in-tolerance scores stay far below it), which is how
+# _assign tells them apart; infeasible cells are never accepted.
+_TOLERANCE_FAIL_COST = 1e3
+_NO_MATCH_COST = 1e6
+
+# Callout fields read by _try_match / _try_equivalent_hole_tapped
+_CALLOUT_MATCH_FIELDS = (
+    "calloutType", "diameter", "depth", "radius", "size",
+    "thread", "threadSize", "pitch", "raw",
+)
+
+# Metric nominal diameter in a top-level threadSize string ("M6", "m8x1.25")
+_M_THREAD_RE = re.compile(r"M(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Types whose bucket is scored by _numeric_cost_matrix
+_NUMERIC_TYPES = {"Hole", "Fillet", "Chamfer"}
+
+# Cache kind for cross-type equivalence checks (others are keyed by callout type)
+_EQUIVALENT = "equivalent"
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a field value.
+
+    The type is kept alongside the value because 1 and 1.0 format
+    differently in match notes.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return (type(value), value)
+
+
+def _callout_key(callout: Dict[str, Any]) -> tuple:
+    """Value key of a callout's match inputs (shared by expanded instances)."""
+    return tuple(_freeze(callout.get(f)) for f in _CALLOUT_MATCH_FIELDS)
+
+
+def _assign(cost_matrix) -> List[Tuple[int, int]]:
+    """Minimum-cost one-to-one assignment, in-tolerance pairs first.
+
+    In-tolerance cells are assigned on their own, so a TOLERANCE_FAIL pair
+    never takes the place of a real match. The rows and columns left over
+    are then assigned among the TOLERANCE_FAIL cells. Infeasible cells are
+    dropped.
+
+    Returns:
+        (row, col) pairs ordered by row
+    """
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+
+    in_tol = cost_matrix < _TOLERANCE_FAIL_COST
+    row_ind, col_ind = linear_sum_assignment(np.where(in_tol, cost_matrix, _NO_MATCH_COST))
+    pairs = [
+        (r, c) for r, c in zip(row_ind.tolist(), col_ind.tolist())
+        if in_tol[r, c]  # infeasible cell filled in by the solver
+    ]
+
+    # Second pass over the leftovers, where only TOLERANCE_FAIL cells remain
+    rows_left = np.ones(cost_matrix.shape[0], dtype=bool)
+    cols_left = np.ones(cost_matrix.shape[1], dtype=bool)
+    for r, c in pairs:
+        rows_left[r] = False
+        cols_left[c] = False
+    rows = np.flatnonzero(rows_left)
+    cols = np.flatnonzero(cols_left)
+    if rows.size and cols.size:
+        leftover = cost_matrix[np.ix_(rows, cols)]
+        if (leftover < _NO_MATCH_COST).any():
+            row_ind, col_ind = linear_sum_assignment(leftover)
+            pairs.extend(
+                (int(rows[r]), int(cols[c]))
+                for r, c in zip(row_ind.tolist(), col_ind.tolist())
+                if leftover[r, c] < _NO_MATCH_COST
+            )
+            pairs.sort()
+    return pairs
+
+
+def _sw_thread_raw_upper(sw_feat: SwFeature) -> str:
+    """Upper-cased SW thread callout text ("" if none)."""
+    return str((sw_feat.thread or {}).get("raw", "") or "").upper()
+
+
+def _sw_key(sw_feat: SwFeature) -> tuple:
+    """Value key of an SW feature's match inputs."""
+    return (
+        sw_feat.feature_type,
+        _freeze(sw_feat.diameter_inches),
+        _freeze(sw_feat.depth_inches),
+        _freeze(sw_feat.radius_inches),
+        _freeze(sw_feat.thread),
+    )
+
 
 class MatchStatus(Enum):
     """Status of a feature match."""
@@ -25,6 +125,35 @@ class MatchStatus(Enum):
     TOLERANCE_FAIL = "tolerance"  # Match found but outside tolerance
     SKIPPED = "skipped"           # Future type, excluded from scoring
 
+    # Members are singletons compared by identity; hash them the same way
+    # instead of Enum's Python-level hash(name), which every dict/Counter
+    # lookup keyed on a status would otherwise pay for.
+    __hash__ = object.__hash__
+
+
+class _DeferredNotes:
+    """Descriptor for MatchResult.notes.
+
+    Accepts either a string or a (format string, args) pair; the pair is
+    only formatted on first read, so results whose notes are never shown
+    skip the float formatting.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return ""  # dataclass field default
+        value = obj.__dict__[self._attr]
+        if not isinstance(value, str):
+            notes_fmt, notes_args = value
+            value = obj.__dict__[self._attr] = notes_fmt.format(*notes_args)
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self._attr] = value
+
 
 @dataclass
 class MatchResult:
@@ -36,13 +165,14 @@ class MatchResult:
         drawing_callout: The callout from drawing evidence (None if MISSING)
         sw_feature: The SolidWorks feature (None if EXTRA)
         delta: Difference value for numeric comparisons
-        notes: Explanation of match/mismatch
+        notes: Explanation of match/mismatch (may be passed as a
+            (format string, args) pair, formatted on first access)
     """
     status: MatchStatus
     drawing_callout: Optional[Dict[str, Any]] = None
     sw_feature: Optional[SwFeature] = None
     delta: Optional[float] = None
-    notes: str = ""
+    notes: str = _DeferredNotes()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -59,6 +189,24 @@ class MatchResult:
         return d
 
 
+@dataclass(slots=True)
+class _CalloutFields:
+    """Match inputs of one drawing callout, read once per match_all call."""
+    ctype: Any
+    diameter: Optional[float]
+    depth: Optional[float]
+    radius: Optional[float]
+    size: Optional[float]
+    view: Any
+    raw_upper: str
+    thread: Optional[Dict[str, Any]]  # normalized, TappedHole only
+
+
+# A candidate match before any MatchResult is built:
+# (status, delta, notes format string, notes format args)
+_Outcome = Tuple[MatchStatus, Optional[float], str, tuple]
+
+
 class FeatureMatcher:
     """
     Match drawing callouts against SolidWorks features.
@@ -99,6 +247,8 @@ class FeatureMatcher:
         self.fillet_tolerance = fillet_tolerance or default_config.fillet_tolerance_inches
         self.chamfer_tolerance = chamfer_tolerance or default_config.chamfer_tolerance_inches
         self.pitch_tolerance = pitch_tolerance or default_config.pitch_tolerance
+        # Per-session cache of pair outcomes, see _match_outcome()
+        self._match_cache: Dict[tuple, Tuple[Optional[_Outcome], float]] = {}
 
     def match_all(
         self,
@@ -116,140 +266,198 @@ class FeatureMatcher:
             List of MatchResult for all features
         """
         results = []
-        used_sw_indices = set()
-        used_callout_indices = set()
+        # Matched/consumed flags by position (1 = used), flipped in place by each pass
+        used_sw = bytearray(len(sw_features))
+        used_callout = bytearray(len(drawing_callouts))
+
+        # Expanded quantity instances repeat the same values, so pair outcomes
+        # are cached on value keys for the duration of this call.
+        self._match_cache = {}
+        callout_keys = [_callout_key(c) for c in drawing_callouts]
+        sw_keys = [_sw_key(f) for f in sw_features]
+        callout_fields = [self._callout_fields(c) for c in drawing_callouts]
+
+        # Bucket indices by type once instead of rescanning both lists per pass
+        callout_buckets: Dict[Any, List[int]] = defaultdict(list)
+        for i, cf in enumerate(callout_fields):
+            callout_buckets[cf.ctype].append(i)
+        sw_buckets: Dict[Any, List[int]] = defaultdict(list)
+        for i, sw_feat in enumerate(sw_features):
+            sw_buckets[sw_feat.feature_type].append(i)
 
-        # Match by type
+        # Match by type (buckets are disjoint, so no pass sees another's picks)
         for callout_type in ["TappedHole", "Hole", "Fillet", "Chamfer"]:
-            type_results, sw_used, callout_used = self._match_by_type(
+            results.extend(self._match_by_type(
                 drawing_callouts,
                 sw_features,
                 callout_type,
-                used_sw_indices,
-                used_callout_indices,
-            )
-            results.extend(type_results)
-            used_sw_indices.update(sw_used)
-            used_callout_indices.update(callout_used)
+                callout_buckets[callout_type],
+                sw_buckets[callout_type],
+                used_sw,
+                used_callout,
+                callout_fields,
+                callout_keys,
+                sw_keys,
+            ))
 
         # Cross-type equivalent matching for hole/tapped-hole semantics.
         # This captures callouts like "⌀.52 33/64 DRILL" that represent a tap drill
         # requirement but may not be parsed as explicit thread notation.
         if default_config.match_hole_tapped_equivalence:
-            eq_results, sw_used, callout_used = self._match_hole_tapped_equivalents(
+            results.extend(self._match_hole_tapped_equivalents(
                 drawing_callouts,
                 sw_features,
-                used_sw_indices,
-                used_callout_indices,
-            )
-            results.extend(eq_results)
-            used_sw_indices.update(sw_used)
-            used_callout_indices.update(callout_used)
-
-        # Skip future types before marking unmatched as MISSING/EXTRA
+                sorted(
+                    i for i in callout_buckets["Hole"] + callout_buckets["TappedHole"]
+                    if not used_callout[i]
+                ),
+                sorted(
+                    i for i in sw_buckets["Hole"] + sw_buckets["TappedHole"]
+                    if not used_sw[i]
+                ),
+                used_sw,
+                used_callout,
+                callout_fields,
+                callout_keys,
+                sw_keys,
+            ))
+
+        # One pass per side over what is left: future types are SKIPPED,
+        # everything else is EXTRA (callouts) or MISSING (SW features).
+        # Results keep the order skipped callouts, skipped SW, missing, extra.
+        skipped_callouts: List[MatchResult] = []
+        extra: List[MatchResult] = []
+        hole_entries = []  # unmatched Hole/TappedHole callouts, for correlation notes
         for i, callout in enumerate(drawing_callouts):
-            if i not in used_callout_indices and callout.get("calloutType") in FUTURE_TYPES:
-                results.append(MatchResult(
+            if used_callout[i]:
+                continue
+            cf = callout_fields[i]
+            if cf.ctype in FUTURE_TYPES:
+                skipped_callouts.append(MatchResult(
                     status=MatchStatus.SKIPPED,
                     drawing_callout=callout,
                     notes=f"Future type skipped: {callout.get('calloutType')}",
                 ))
-                used_callout_indices.add(i)
+                continue
+            if cf.ctype in {"Hole", "TappedHole"}:
+                c_dia = cf.diameter
+                # Non-finite diameters can never fall within a tolerance
+                if c_dia is not None and math.isfinite(c_dia):
+                    hole_entries.append((c_dia, i, callout))
+            extra.append(MatchResult(
+                status=MatchStatus.EXTRA,
+                drawing_callout=callout,
+                notes=f"Drawing callout not in SW model: {callout.get('raw', '')}",
+            ))
+        hole_entries.sort(key=lambda e: (e[0], e[1]))
+        hole_index = ([e[0] for e in hole_entries], hole_entries)
 
+        skipped_sw: List[MatchResult] = []
+        missing: List[MatchResult] = []
         for i, sw_feat in enumerate(sw_features):
-            if i not in used_sw_indices and sw_feat.feature_type in FUTURE_TYPES:
-                results.append(MatchResult(
+            if used_sw[i]:
+                continue
+            if sw_feat.feature_type in FUTURE_TYPES:
+                skipped_sw.append(MatchResult(
                     status=MatchStatus.SKIPPED,
                     sw_feature=sw_feat,
                     notes=f"Future type skipped: {sw_feat.feature_type}",
                 ))
-                used_sw_indices.add(i)
-
-        # Add unmatched SW features as MISSING
-        for i, sw_feat in enumerate(sw_features):
-            if i not in used_sw_indices:
-                note = f"SW {sw_feat.feature_type} not found on drawing"
-                corr = self._find_correlated_extra_callout(
-                    sw_feat,
-                    drawing_callouts,
-                    used_callout_indices,
-                )
-                if corr:
-                    note += f"; probable correlation with extra drawing callout: {corr}"
-                results.append(MatchResult(
-                    status=MatchStatus.MISSING,
-                    sw_feature=sw_feat,
-                    notes=note,
-                ))
-
-        # Add unmatched drawing callouts as EXTRA
-        for i, callout in enumerate(drawing_callouts):
-            if i not in used_callout_indices:
-                results.append(MatchResult(
-                    status=MatchStatus.EXTRA,
-                    drawing_callout=callout,
-                    notes=f"Drawing callout not in SW model: {callout.get('raw', '')}",
-                ))
+                continue
+            note = f"SW {sw_feat.feature_type} not found on drawing"
+            corr = self._find_correlated_extra_callout(sw_feat, hole_index)
+            if corr:
+                note += f"; probable correlation with extra drawing callout: {corr}"
+            missing.append(MatchResult(
+                status=MatchStatus.MISSING,
+                sw_feature=sw_feat,
+                notes=note,
+            ))
 
+        results.extend(skipped_callouts)
+        results.extend(skipped_sw)
+        results.extend(missing)
+        results.extend(extra)
         return results
 
     def _match_hole_tapped_equivalents(
         self,
         drawing_callouts: List[Dict[str, Any]],
         sw_features: List[SwFeature],
-        exclude_sw: set,
-        exclude_callout: set,
-    ) -> Tuple[List[MatchResult], set, set]:
+        callout_indices: List[int],
+        sw_indices: List[int],
+        used_sw: bytearray,
+        used_callout: bytearray,
+        callout_fields: List[_CalloutFields],
+        callout_keys: Optional[List[tuple]] = None,
+        sw_keys: Optional[List[tuple]] = None,
+    ) -> List[MatchResult]:
         """
         Match cross-type hole/tapped-hole pairs by diameter proximity.
 
         This is a fallback stage after strict same-type matching.
+        callout_indices / sw_indices are the still-unmatched Hole and
+        TappedHole items, in index order. Matched items are flagged in
+        used_sw / used_callout.
         """
         results: List[MatchResult] = []
-        sw_used = set()
-        callout_used = set()
+        # Nothing left to pair on one side: skip building candidates at all
+        if not callout_indices or not sw_indices:
+            return results
 
-        candidate_callouts = [
-            (i, c) for i, c in enumerate(drawing_callouts)
-            if i not in exclude_callout and c.get("calloutType") in {"Hole", "TappedHole"}
-        ]
+        candidate_callouts = [(i, drawing_callouts[i]) for i in callout_indices]
+        # SW thread callout text, upper-cased once per feature
         candidate_sw = [
-            (i, f) for i, f in enumerate(sw_features)
-            if i not in exclude_sw and f.feature_type in {"Hole", "TappedHole"}
+            (i, sw_features[i], _sw_thread_raw_upper(sw_features[i])) for i in sw_indices
         ]
 
         for callout_idx, callout in candidate_callouts:
-            best_match: Optional[MatchResult] = None
+            cf = callout_fields[callout_idx]
+            best_match: Optional[_Outcome] = None
             best_score = float("inf")
             best_sw_idx: Optional[int] = None
 
-            for sw_idx, sw_feat in candidate_sw:
-                if sw_idx in sw_used:
+            for sw_idx, sw_feat, sw_thread_raw in candidate_sw:
+                if used_sw[sw_idx]:
                     continue
                 # only cross-type pairs here
-                if callout.get("calloutType") == sw_feat.feature_type:
+                if cf.ctype == sw_feat.feature_type:
                     continue
 
-                m, score = self._try_equivalent_hole_tapped(callout, sw_feat)
+                m, score = self._match_outcome(
+                    _EQUIVALENT, callout, sw_feat,
+                    callout_keys[callout_idx] if callout_keys else None,
+                    sw_keys[sw_idx] if sw_keys else None,
+                    cf,
+                    sw_thread_raw,
+                )
                 if m and score < best_score:
                     best_match = m
                     best_score = score
                     best_sw_idx = sw_idx
 
             if best_match and best_sw_idx is not None:
-                results.append(best_match)
-                sw_used.add(best_sw_idx)
-                callout_used.add(callout_idx)
+                results.append(self._build_result(best_match, callout, sw_features[best_sw_idx]))
+                used_sw[best_sw_idx] = 1
+                used_callout[callout_idx] = 1
 
-        return results, sw_used, callout_used
+        return results
 
     def _try_equivalent_hole_tapped(
         self,
         callout: Dict[str, Any],
         sw_feat: SwFeature,
-    ) -> Tuple[Optional[MatchResult], float]:
-        """Try a semantic-equivalent hole/tapped-hole match."""
-        callout_dia = self._get_callout_diameter(callout)
+        cf: Optional[_CalloutFields] = None,
+        sw_thread_raw: Optional[str] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
+        """Try a semantic-equivalent hole/tapped-hole match.
+
+        cf / sw_thread_raw pass the callout fields and upper-cased SW thread
+        text when the caller has them precomputed.
+        """
+        if cf is None:
+            cf = self._callout_fields(callout)
+        callout_dia = cf.diameter
         sw_dia = sw_feat.diameter_inches
         if callout_dia is None or sw_dia is None:
             return None, float("inf")
@@ -259,145 +467,382 @@ class FeatureMatcher:
         if abs(delta) > tol:
             return None, float("inf")
 
-        raw = str(callout.get("raw", "") or "")
-        raw_upper = raw.upper()
+        raw_upper = cf.raw_upper
         bonus = 0.0
         if "DRILL" in raw_upper:
             bonus += 0.003
-        sw_thread_raw = str((sw_feat.thread or {}).get("raw", "") or "").upper()
+        if sw_thread_raw is None:
+            sw_thread_raw = _sw_thread_raw_upper(sw_feat)
         if sw_thread_raw and sw_thread_raw in raw_upper:
             bonus += 0.003
 
         score = max(0.0, abs(delta) - bonus)
-        note = (
-            f"Equivalent match ({callout.get('calloutType')}<->{sw_feat.feature_type}) "
-            f"by diameter: {callout_dia:.4f}\" (delta={delta:+.4f}\")"
-        )
-        return MatchResult(
-            status=MatchStatus.MATCHED,
-            drawing_callout=callout,
-            sw_feature=sw_feat,
-            delta=delta,
-            notes=note,
+        return (
+            MatchStatus.MATCHED, delta,
+            "Equivalent match ({}<->{}) by diameter: {:.4f}\" (delta={:+.4f}\")",
+            (cf.ctype, sw_feat.feature_type, callout_dia, delta),
         ), score
 
     def _find_correlated_extra_callout(
         self,
         sw_feat: SwFeature,
-        drawing_callouts: List[Dict[str, Any]],
-        used_callout_indices: set,
+        hole_index: Tuple[List[float], List[Tuple[float, int, Dict[str, Any]]]],
     ) -> Optional[str]:
         """
         Find an unmatched drawing callout that is numerically close to an SW feature.
+
+        hole_index holds the unmatched Hole/TappedHole callouts as parallel
+        (diameters, (diameter, callout index, callout) entries) lists sorted
+        by diameter; only the window around the SW diameter is scanned. Ties
+        go to the earliest callout.
         """
         if sw_feat.feature_type not in {"Hole", "TappedHole"}:
             return None
         sw_dia = sw_feat.diameter_inches
-        if sw_dia is None:
+        if sw_dia is None or not math.isfinite(sw_dia):
             return None
 
         tol = default_config.match_extra_missing_correlation_tolerance_inches
-        best = None
+        diameters, entries = hole_index
+        # Slightly widened window; the exact tolerance test is applied below
+        margin = tol * 1e-6
+        lo = bisect_left(diameters, sw_dia - tol - margin)
+        hi = bisect_right(diameters, sw_dia + tol + margin)
+
+        best_entry = None
         best_delta = float("inf")
-        for i, callout in enumerate(drawing_callouts):
-            if i in used_callout_indices:
-                continue
-            ctype = callout.get("calloutType")
-            if ctype not in {"Hole", "TappedHole"}:
-                continue
-            c_dia = self._get_callout_diameter(callout)
-            if c_dia is None:
-                continue
-            d = abs(c_dia - sw_dia)
-            if d <= tol and d < best_delta:
+        for entry in entries[lo:hi]:
+            d = abs(entry[0] - sw_dia)
+            if d <= tol and (d < best_delta or (d == best_delta and entry[1] < best_entry[1])):
                 best_delta = d
-                raw = str(callout.get("raw", "") or "").replace("\n", " ")
-                best = f"{ctype} dia={c_dia:.4f}\" (delta={d:.4f}\") raw='{raw[:80]}'"
-        return best
+                best_entry = entry
+        if best_entry is None:
+            return None
+
+        c_dia, _, callout = best_entry
+        ctype = callout.get("calloutType")
+        raw = str(callout.get("raw", "") or "").replace("\n", " ")
+        return f"{ctype} dia={c_dia:.4f}\" (delta={best_delta:.4f}\") raw='{raw[:80]}'"
 
     def _match_by_type(
         self,
         drawing_callouts: List[Dict[str, Any]],
         sw_features: List[SwFeature],
         callout_type: str,
-        exclude_sw: set,
-        exclude_callout: set,
-    ) -> Tuple[List[MatchResult], set, set]:
-        """Match features of a specific type."""
+        callout_indices: List[int],
+        sw_indices: List[int],
+        used_sw: bytearray,
+        used_callout: bytearray,
+        callout_fields: List[_CalloutFields],
+        callout_keys: Optional[List[tuple]] = None,
+        sw_keys: Optional[List[tuple]] = None,
+    ) -> List[MatchResult]:
+        """Match features of a specific type.
+
+        callout_indices / sw_indices select the unmatched items of
+        callout_type; matched items are flagged in used_sw / used_callout.
+        Pairs are chosen by minimum-cost bipartite assignment over the
+        composite score, so an early callout cannot claim an SW feature that
+        a later callout fits better. In-tolerance pairs are assigned first;
+        TOLERANCE_FAIL pairs are only formed from the callouts and SW
+        features left unmatched after that (see _assign).
+        """
         results = []
-        sw_used = set()
-        callout_used = set()
 
-        # Filter to this type
-        type_callouts = [
-            (i, c) for i, c in enumerate(drawing_callouts)
-            if c.get("calloutType") == callout_type and i not in exclude_callout
-        ]
-        type_sw = [
-            (i, f) for i, f in enumerate(sw_features)
-            if f.feature_type == callout_type and i not in exclude_sw
-        ]
+        type_callouts = [(i, drawing_callouts[i]) for i in callout_indices]
+        type_fields = [callout_fields[i] for i in callout_indices]
+        type_sw = [(i, sw_features[i]) for i in sw_indices]
 
-        # Try to match each callout to a SW feature
-        spatial_weight = default_config.spatial_match_weight
-        for callout_idx, callout in type_callouts:
-            best_match = None
-            best_score = float("inf")
-            best_sw_idx = None
+        if not type_callouts or not type_sw:
+            return results
+
+        # Score every callout/SW pair, then pick the globally cheapest
+        # one-to-one assignment (Hungarian) instead of greedy first-come.
+        if callout_type in _NUMERIC_TYPES:
+            pairs = self._numeric_assignment(callout_type, type_fields, type_sw)
+        else:
+            pairs = _assign(self._pairwise_cost_matrix(
+                callout_type, type_callouts, type_fields, type_sw, callout_keys, sw_keys,
+            ))
+
+        # MatchResults are only built for the accepted pairs
+        for r, c in pairs:
+            callout_idx, callout = type_callouts[r]
+            sw_idx, sw_feat = type_sw[c]
+            outcome, _ = self._match_outcome(
+                callout_type, callout, sw_feat,
+                callout_keys[callout_idx] if callout_keys else None,
+                sw_keys[sw_idx] if sw_keys else None,
+                type_fields[r],
+            )
+            results.append(self._build_result(outcome, callout, sw_feat))
+            used_sw[sw_idx] = 1
+            used_callout[callout_idx] = 1
+
+        return results
+
+    def _pairwise_cost_matrix(
+        self,
+        callout_type: str,
+        type_callouts: List[Tuple[int, Dict[str, Any]]],
+        type_fields: List[_CalloutFields],
+        type_sw: List[Tuple[int, SwFeature]],
+        callout_keys: Optional[List[tuple]],
+        sw_keys: Optional[List[tuple]],
+    ):
+        """Assignment cost per callout/SW pair via _try_match (threads)."""
+        import numpy as np
 
-            for sw_idx, sw_feat in type_sw:
-                if sw_idx in sw_used:
+        spatial_weight = default_config.spatial_match_weight
+        cost_matrix = np.full((len(type_callouts), len(type_sw)), _NO_MATCH_COST)
+        for r, (callout_idx, callout) in enumerate(type_callouts):
+            cf = type_fields[r]
+            for c, (sw_idx, sw_feat) in enumerate(type_sw):
+                outcome, delta = self._match_outcome(
+                    callout_type, callout, sw_feat,
+                    callout_keys[callout_idx] if callout_keys else None,
+                    sw_keys[sw_idx] if sw_keys else None,
+                    cf,
+                )
+                if not outcome:
+                    continue
+                # Composite score: numeric delta + spatial penalty
+                vp = self._view_penalty(callout, sw_feat)
+                score = abs(delta) + vp * spatial_weight
+                if not math.isfinite(score):
                     continue
+                if outcome[0] is MatchStatus.TOLERANCE_FAIL:
+                    score += _TOLERANCE_FAIL_COST
+                cost_matrix[r, c] = score
+        return cost_matrix
+
+    def _numeric_assignment(
+        self,
+        callout_type: str,
+        type_fields: List[_CalloutFields],
+        type_sw: List[Tuple[int, SwFeature]],
+    ) -> List[Tuple[int, int]]:
+        """Minimum-cost assignment for a Hole/Fillet/Chamfer bucket.
+
+        A pair can only match when its values are within reach of each other
+        (3x tolerance for holes, tolerance otherwise), so the SW values are
+        sorted once and np.searchsorted finds each callout's candidate window.
+        Callouts with overlapping windows form a block; blocks share no
+        feasible pair and are solved independently, which keeps cost matrix
+        and solver work near O(N log M + K) instead of O(N * M) when the
+        bucket spans many distinct sizes.
+
+        Returns:
+            Accepted (callout position, SW position) pairs, ordered by callout
+        """
+        import numpy as np
+
+        c_arr, s_arr, tol, tol_fail_limit = self._numeric_values(
+            callout_type, type_fields, [f for _, f in type_sw],
+        )
+        # Pad the window so rounding in c +/- reach never drops a feasible pair
+        reach = max(tol, tol_fail_limit) * (1 + 1e-9) + 1e-12
+
+        order = np.argsort(s_arr, kind="stable")  # NaN (missing) sorts last
+        s_sorted = s_arr[order]
+        with np.errstate(invalid="ignore"):
+            lo = np.searchsorted(s_sorted, c_arr - reach, side="left")
+            hi = np.searchsorted(s_sorted, c_arr + reach, side="right")
+        hi[np.isnan(c_arr)] = 0  # a missing value never matches
+
+        pairs: List[Tuple[int, int]] = []
+        rows = [r for r in np.argsort(c_arr, kind="stable").tolist() if lo[r] < hi[r]]
+        start = 0
+        while start < len(rows):
+            block_lo, block_hi = lo[rows[start]], hi[rows[start]]
+            end = start + 1
+            # Windows move monotonically with the sorted callout values
+            while end < len(rows) and lo[rows[end]] < block_hi:
+                block_hi = max(block_hi, hi[rows[end]])
+                end += 1
+            block_rows = sorted(rows[start:end])
+            block_cols = sorted(order[block_lo:block_hi].tolist())
+            cost_matrix = self._numeric_cost_matrix(
+                callout_type,
+                [type_fields[r] for r in block_rows],
+                [type_sw[c] for c in block_cols],
+            )
+            pairs.extend(
+                (block_rows[r], block_cols[c]) for r, c in _assign(cost_matrix)
+            )
+            start = end
 
-                match_result, delta = self._try_match(callout, sw_feat, callout_type)
-                if match_result:
-                    # Composite score: numeric delta + spatial penalty
-                    vp = self._view_penalty(callout, sw_feat)
-                    score = abs(delta) + vp * spatial_weight
-                    if score < best_score:
-                        best_match = match_result
-                        best_score = score
-                        best_sw_idx = sw_idx
+        pairs.sort()
+        return pairs
 
-            if best_match:
-                results.append(best_match)
-                sw_used.add(best_sw_idx)
-                callout_used.add(callout_idx)
+    def _numeric_values(
+        self,
+        callout_type: str,
+        type_fields: List[_CalloutFields],
+        feats: List[SwFeature],
+    ):
+        """Compared values and tolerances of a Hole/Fillet/Chamfer bucket.
 
-        return results, sw_used, callout_used
+        Returns:
+            (callout values, SW values, tolerance, TOLERANCE_FAIL limit);
+            missing values are NaN, the limit is negative when there is no
+            TOLERANCE_FAIL band
+        """
+        import numpy as np
+
+        if callout_type == "Hole":
+            c_vals = [cf.diameter for cf in type_fields]
+            s_vals = [f.diameter_inches for f in feats]
+            tol = self.hole_tolerance
+        elif callout_type == "Fillet":
+            c_vals = [cf.radius for cf in type_fields]
+            s_vals = [f.radius_inches for f in feats]
+            tol = self.fillet_tolerance
+        else:
+            c_vals = [cf.size for cf in type_fields]
+            s_vals = [f.radius_inches for f in feats]  # Stored in radius field
+            tol = self.chamfer_tolerance
+
+        # None never matches: NaN fails every comparison
+        c_arr = np.array([np.nan if v is None else v for v in c_vals], dtype=np.float64)
+        s_arr = np.array([np.nan if v is None else v for v in s_vals], dtype=np.float64)
+        # Close but outside tolerance still pairs as TOLERANCE_FAIL (holes)
+        tol_fail_limit = tol * 3 if callout_type == "Hole" else -1.0
+        return c_arr, s_arr, tol, tol_fail_limit
+
+    def _numeric_cost_matrix(
+        self,
+        callout_type: str,
+        type_fields: List[_CalloutFields],
+        type_sw: List[Tuple[int, SwFeature]],
+    ):
+        """Vectorized assignment cost for a Hole/Fillet/Chamfer bucket.
+
+        Computes the same composite score as _pairwise_cost_matrix, following
+        _match_hole / _match_fillet / _match_chamfer, for all pairs at once.
+        Runs the compiled kernel from _matcher_kernels when Numba is present.
+        """
+        import numpy as np
+
+        feats = [f for _, f in type_sw]
+        c_arr, s_arr, tol, tol_fail_limit = self._numeric_values(
+            callout_type, type_fields, feats,
+        )
+
+        if callout_type == "Hole":
+            # Depth breaks ties where both sides have one
+            c_depth = [cf.depth for cf in type_fields]
+            s_depth = [f.depth_inches for f in feats]
+        else:
+            c_depth = [None] * len(type_fields)
+            s_depth = [None] * len(feats)
+        c_has = np.array([d is not None for d in c_depth], dtype=bool)
+        s_has = np.array([d is not None for d in s_depth], dtype=bool)
+        c_d = np.array([d if d is not None else 0.0 for d in c_depth], dtype=np.float64)
+        s_d = np.array([d if d is not None else 0.0 for d in s_depth], dtype=np.float64)
+        view_penalty = self._view_penalty_matrix([cf.view for cf in type_fields], feats)
+        spatial_weight = default_config.spatial_match_weight
+
+        from . import _matcher_kernels
+        if _matcher_kernels.NUMBA_AVAILABLE:
+            return _matcher_kernels.numeric_cost_matrix(
+                c_arr, s_arr, c_has, c_d, s_has, s_d, view_penalty,
+                tol, tol_fail_limit, 0.01, spatial_weight,
+                _TOLERANCE_FAIL_COST, _NO_MATCH_COST,
+            )
+
+        with np.errstate(invalid="ignore"):
+            abs_delta = np.abs(c_arr[:, None] - s_arr[None, :])
+            matched = abs_delta <= tol
+            tol_fail = ~matched & (abs_delta <= tol_fail_limit)
+            depth_penalty = np.where(
+                c_has[:, None] & s_has[None, :],
+                np.abs(c_d[:, None] - s_d[None, :]) * 0.01,  # weighted low
+                0.0,
+            )
+            score = abs_delta + depth_penalty + view_penalty * spatial_weight
+            feasible = (matched | tol_fail) & np.isfinite(score)
+            score = np.where(tol_fail, score + _TOLERANCE_FAIL_COST, score)
+        return np.where(feasible, score, _NO_MATCH_COST)
+
+    def _match_outcome(
+        self,
+        kind: str,
+        callout: Dict[str, Any],
+        sw_feat: SwFeature,
+        callout_key: Optional[tuple],
+        sw_key: Optional[tuple],
+        cf: Optional[_CalloutFields] = None,
+        sw_thread_raw: Optional[str] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
+        """
+        Memoized _try_match (kind = callout type) or _try_equivalent_hole_tapped.
+
+        Outcomes depend only on field values, so they are cached on the
+        value keys. Without keys the match is computed directly. cf and
+        sw_thread_raw pass precomputed per-item values through.
+        """
+        key = (kind, callout_key, sw_key) if callout_key and sw_key else None
+        hit = self._match_cache.get(key) if key else None
+        if hit is None:
+            if kind == _EQUIVALENT:
+                hit = self._try_equivalent_hole_tapped(callout, sw_feat, cf, sw_thread_raw)
+            else:
+                hit = self._try_match(callout, sw_feat, kind, cf)
+            if key is not None:
+                self._match_cache[key] = hit
+        return hit
+
+    @staticmethod
+    def _build_result(
+        outcome: _Outcome,
+        callout: Dict[str, Any],
+        sw_feat: SwFeature,
+    ) -> MatchResult:
+        """Build the MatchResult for an accepted outcome."""
+        status, delta, notes_fmt, notes_args = outcome
+        return MatchResult(
+            status=status,
+            drawing_callout=callout,
+            sw_feature=sw_feat,
+            delta=delta,
+            notes=(notes_fmt, notes_args),
+        )
 
     def _try_match(
         self,
         callout: Dict[str, Any],
         sw_feat: SwFeature,
         callout_type: str,
-    ) -> Tuple[Optional[MatchResult], float]:
-        """Try to match a single callout to a SW feature."""
+        cf: Optional[_CalloutFields] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
+        """Try to match a single callout to a SW feature.
+
+        cf optionally passes the callout's precomputed fields.
+        """
+        if cf is None:
+            cf = self._callout_fields(callout)
 
         if callout_type == "TappedHole":
-            return self._match_thread(callout, sw_feat)
+            return self._match_thread(callout, sw_feat, cf.thread)
         elif callout_type == "Hole":
-            return self._match_hole(callout, sw_feat)
+            return self._match_hole(callout, sw_feat, cf)
         elif callout_type == "Fillet":
-            return self._match_fillet(callout, sw_feat)
+            return self._match_fillet(callout, sw_feat, cf)
         elif callout_type == "Chamfer":
-            return self._match_chamfer(callout, sw_feat)
+            return self._match_chamfer(callout, sw_feat, cf)
 
         return None, float("inf")
 
-    def _match_thread(
-        self,
-        callout: Dict[str, Any],
-        sw_feat: SwFeature,
-    ) -> Tuple[Optional[MatchResult], float]:
-        """Match tapped hole / thread features."""
+    def _normalize_callout_thread(self, callout: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the callout's thread dict (a copy), building one if needed."""
         callout_thread = dict(callout.get("thread", {}) or {})
         # Backward compatibility: many regex paths emit threadSize/pitch at top-level.
         # Build a minimal thread object so matcher can still compare nominal diameter.
         if not callout_thread:
             thread_size = str(callout.get("threadSize", "") or "")
             pitch_val = callout.get("pitch")
-            m = re.search(r"M(\d+(?:\.\d+)?)", thread_size, re.IGNORECASE)
+            m = _M_THREAD_RE.search(thread_size)
             if m:
                 callout_thread = {
                     "standard": "Metric",
@@ -409,6 +854,17 @@ class FeatureMatcher:
                         callout_thread["pitch"] = float(pitch_val)
                     except (TypeError, ValueError):
                         pass
+        return callout_thread
+
+    def _match_thread(
+        self,
+        callout: Dict[str, Any],
+        sw_feat: SwFeature,
+        callout_thread: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
+        """Match tapped hole / thread features."""
+        if callout_thread is None:
+            callout_thread = self._normalize_callout_thread(callout)
         sw_thread = sw_feat.thread or {}
 
         # Compare nominal diameter (metric)
@@ -425,20 +881,14 @@ class FeatureMatcher:
                     # Ignore clearly implausible OCR pitch values (e.g. "55" from "1.5").
                     metric_pitch_plausible = 0.2 <= float(callout_pitch) <= 6.0
                     if metric_pitch_plausible and abs(callout_pitch - sw_pitch) > self.pitch_tolerance:
-                        return MatchResult(
-                            status=MatchStatus.TOLERANCE_FAIL,
-                            drawing_callout=callout,
-                            sw_feature=sw_feat,
-                            delta=callout_pitch - sw_pitch,
-                            notes=f"Thread pitch mismatch: drawing={callout_pitch}, SW={sw_pitch}",
+                        return (
+                            MatchStatus.TOLERANCE_FAIL, callout_pitch - sw_pitch,
+                            "Thread pitch mismatch: drawing={}, SW={}", (callout_pitch, sw_pitch),
                         ), delta
 
-                return MatchResult(
-                    status=MatchStatus.MATCHED,
-                    drawing_callout=callout,
-                    sw_feature=sw_feat,
-                    delta=delta,
-                    notes=f"Thread match: M{callout_nom}x{callout_pitch or '?'}",
+                return (
+                    MatchStatus.MATCHED, delta,
+                    "Thread match: M{}x{}", (callout_nom, callout_pitch or '?'),
                 ), delta
 
         # Compare TPI for imperial
@@ -446,20 +896,14 @@ class FeatureMatcher:
         sw_tpi = sw_thread.get("tpi")
         if callout_tpi and sw_tpi:
             if callout_tpi == sw_tpi:
-                return MatchResult(
-                    status=MatchStatus.MATCHED,
-                    drawing_callout=callout,
-                    sw_feature=sw_feat,
-                    delta=0,
-                    notes=f"Thread match: {callout_tpi} TPI",
+                return (
+                    MatchStatus.MATCHED, 0,
+                    "Thread match: {} TPI", (callout_tpi,),
                 ), 0
             else:
-                return MatchResult(
-                    status=MatchStatus.TOLERANCE_FAIL,
-                    drawing_callout=callout,
-                    sw_feature=sw_feat,
-                    delta=callout_tpi - sw_tpi,
-                    notes=f"TPI mismatch: drawing={callout_tpi}, SW={sw_tpi}",
+                return (
+                    MatchStatus.TOLERANCE_FAIL, callout_tpi - sw_tpi,
+                    "TPI mismatch: drawing={}, SW={}", (callout_tpi, sw_tpi),
                 ), abs(callout_tpi - sw_tpi)
 
         return None, float("inf")
@@ -468,14 +912,17 @@ class FeatureMatcher:
         self,
         callout: Dict[str, Any],
         sw_feat: SwFeature,
-    ) -> Tuple[Optional[MatchResult], float]:
+        cf: Optional[_CalloutFields] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
         """Match plain hole features.
 
         Uses depth as a tie-breaking penalty when multiple SW holes match
         by diameter. Depth delta is weighted lower than diameter delta so
         it only affects ranking, never causes a reject.
         """
-        callout_dia = self._get_callout_diameter(callout)
+        if cf is None:
+            cf = self._callout_fields(callout)
+        callout_dia = cf.diameter
         sw_dia = sw_feat.diameter_inches
 
         if callout_dia is None or sw_dia is None:
@@ -485,7 +932,7 @@ class FeatureMatcher:
 
         # Depth-aware tie-breaking: add a small penalty based on depth mismatch
         depth_penalty = 0.0
-        callout_depth = self._get_callout_depth(callout)
+        callout_depth = cf.depth
         sw_depth = sw_feat.depth_inches
         if callout_depth is not None and sw_depth is not None:
             depth_penalty = abs(callout_depth - sw_depth) * 0.01  # weighted low
@@ -493,22 +940,16 @@ class FeatureMatcher:
         sort_key = abs(delta) + depth_penalty
 
         if abs(delta) <= self.hole_tolerance:
-            return MatchResult(
-                status=MatchStatus.MATCHED,
-                drawing_callout=callout,
-                sw_feature=sw_feat,
-                delta=delta,
-                notes=f"Hole match: {callout_dia:.4f}\" (delta={delta:+.4f}\")",
+            return (
+                MatchStatus.MATCHED, delta,
+                "Hole match: {:.4f}\" (delta={:+.4f}\")", (callout_dia, delta),
             ), sort_key
         else:
             # Close but outside tolerance
             if abs(delta) <= self.hole_tolerance * 3:
-                return MatchResult(
-                    status=MatchStatus.TOLERANCE_FAIL,
-                    drawing_callout=callout,
-                    sw_feature=sw_feat,
-                    delta=delta,
-                    notes=f"Hole size mismatch: drawing={callout_dia:.4f}\", SW={sw_dia:.4f}\"",
+                return (
+                    MatchStatus.TOLERANCE_FAIL, delta,
+                    "Hole size mismatch: drawing={:.4f}\", SW={:.4f}\"", (callout_dia, sw_dia),
                 ), sort_key
 
         return None, float("inf")
@@ -517,9 +958,10 @@ class FeatureMatcher:
         self,
         callout: Dict[str, Any],
         sw_feat: SwFeature,
-    ) -> Tuple[Optional[MatchResult], float]:
+        cf: Optional[_CalloutFields] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
         """Match fillet features."""
-        callout_radius = self._get_callout_radius(callout)
+        callout_radius = (cf or self._callout_fields(callout)).radius
         sw_radius = sw_feat.radius_inches
 
         if callout_radius is None or sw_radius is None:
@@ -528,12 +970,9 @@ class FeatureMatcher:
         delta = callout_radius - sw_radius
 
         if abs(delta) <= self.fillet_tolerance:
-            return MatchResult(
-                status=MatchStatus.MATCHED,
-                drawing_callout=callout,
-                sw_feature=sw_feat,
-                delta=delta,
-                notes=f"Fillet match: R{callout_radius:.3f}\"",
+            return (
+                MatchStatus.MATCHED, delta,
+                "Fillet match: R{:.3f}\"", (callout_radius,),
             ), delta
 
         return None, float("inf")
@@ -542,9 +981,10 @@ class FeatureMatcher:
         self,
         callout: Dict[str, Any],
         sw_feat: SwFeature,
-    ) -> Tuple[Optional[MatchResult], float]:
+        cf: Optional[_CalloutFields] = None,
+    ) -> Tuple[Optional[_Outcome], float]:
         """Match chamfer features."""
-        callout_dist = self._get_callout_chamfer_distance(callout)
+        callout_dist = (cf or self._callout_fields(callout)).size
         sw_dist = sw_feat.radius_inches  # Stored in radius field
 
         if callout_dist is None or sw_dist is None:
@@ -553,12 +993,9 @@ class FeatureMatcher:
         delta = callout_dist - sw_dist
 
         if abs(delta) <= self.chamfer_tolerance:
-            return MatchResult(
-                status=MatchStatus.MATCHED,
-                drawing_callout=callout,
-                sw_feature=sw_feat,
-                delta=delta,
-                notes=f"Chamfer match: {callout_dist:.3f}\" x 45°",
+            return (
+                MatchStatus.MATCHED, delta,
+                "Chamfer match: {:.3f}\" x 45°", (callout_dist,),
             ), delta
 
         return None, float("inf")
@@ -585,10 +1022,44 @@ class FeatureMatcher:
             return 0.5
         return 0.0 if callout_view in sw_views else 0.3
 
+    def _view_penalty_matrix(
+        self,
+        c_views: List[Any],
+        sw_feats: List[SwFeature],
+    ):
+        """_view_penalty for every callout/SW pair, one pass per distinct view.
+
+        c_views holds each callout's "view" value.
+        """
+        import numpy as np
+
+        s_views = [getattr(f, "visible_in_views", []) for f in sw_feats]
+        s_has = np.array([bool(v) for v in s_views], dtype=bool)
+        penalty = np.full((len(c_views), len(sw_feats)), 0.5)
+        for view in {v for v in c_views if v}:
+            rows = np.array([v == view for v in c_views], dtype=bool)
+            seen = np.array([bool(v) and view in v for v in s_views], dtype=bool)
+            penalty[np.ix_(rows, s_has)] = np.where(seen[s_has], 0.0, 0.3)
+        return penalty
+
     # ------------------------------------------------------------------
     # Field accessors for drawing callout dicts
     # ------------------------------------------------------------------
 
+    def _callout_fields(self, callout: Dict[str, Any]) -> _CalloutFields:
+        """Read all match inputs of a callout in one pass."""
+        ctype = callout.get("calloutType")
+        return _CalloutFields(
+            ctype=ctype,
+            diameter=self._get_callout_diameter(callout),
+            depth=self._get_callout_depth(callout),
+            radius=self._get_callout_radius(callout),
+            size=self._get_callout_chamfer_distance(callout),
+            view=callout.get("view"),
+            raw_upper=str(callout.get("raw", "") or "").upper(),
+            thread=self._normalize_callout_thread(callout) if ctype == "TappedHole" else None,
+        )
+
     def _get_callout_diameter(self, callout: Dict[str, Any]) -> Optional[float]:
         """Get diameter from callout dict."""
         d = callout.get("diameter")
@@ -634,11 +1105,12 @@ class FeatureMatcher:
             - instance_match_rate (matched / (matched + missing + tolerance_fail))
             - total_rate (matched / (matched + missing + extra + tolerance_fail))
         """
-        matched = sum(1 for r in results if r.status == MatchStatus.MATCHED)
-        missing = sum(1 for r in results if r.status == MatchStatus.MISSING)
-        extra = sum(1 for r in results if r.status == MatchStatus.EXTRA)
-        skipped = sum(1 for r in results if r.status == MatchStatus.SKIPPED)
-        tolerance_fail = sum(1 for r in results if r.status == MatchStatus.TOLERANCE_FAIL)
+        counts = Counter(r.status for r in results)
+        matched = counts[MatchStatus.MATCHED]
+        missing = counts[MatchStatus.MISSING]
+        extra = counts[MatchStatus.EXTRA]
+        skipped = counts[MatchStatus.SKIPPED]
+        tolerance_fail = counts[MatchStatus.TOLERANCE_FAIL]
 
         instance_denom = matched + missing + tolerance_fail
         total_denom = matched + missing + extra + tolerance_fail
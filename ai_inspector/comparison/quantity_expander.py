@@ -16,7 +16,7 @@ Example:
 MUST be called on BOTH sides before matching and evaluation.
 """
 
-from copy import deepcopy
+from dataclasses import replace
 from typing import Any, Dict, List, Tuple
 
 from .sw_extractor import SwFeature
@@ -26,8 +26,10 @@ def expand_drawing_callouts(callouts: List[Dict[str, Any]]) -> List[Dict[str, An
     """
     Expand drawing callouts by their quantity field.
 
-    A callout with quantity=4 becomes 4 individual callouts,
-    each with quantity=1 and an _instance_index field.
+    A callout with quantity=4 becomes 4 entries with quantity=1 and
+    _original_quantity=4. The entries are references to one shared dict:
+    the matcher only reads callouts and tracks instances by list position,
+    so treat the expanded list as read-only.
     Callouts without quantity or quantity=1 pass through unchanged.
 
     Args:
@@ -49,20 +51,15 @@ def expand_drawing_callouts(callouts: List[Dict[str, Any]]) -> List[Dict[str, An
         except (ValueError, TypeError):
             qty = 1
 
-        if qty == 1:
-            # Pass through unchanged (add instance metadata)
-            instance = dict(callout)
-            instance["_instance_index"] = 0
-            instance["_original_quantity"] = 1
-            expanded.append(instance)
-        else:
-            # Expand into individual instances
-            for i in range(qty):
-                instance = deepcopy(callout)
-                instance["quantity"] = 1
-                instance["_instance_index"] = i
-                instance["_original_quantity"] = qty
-                expanded.append(instance)
+        # One copy per source callout (flat apart from the thread dict),
+        # repeated qty times instead of materializing qty copies
+        instance = dict(callout)
+        if isinstance(instance.get("thread"), dict):
+            instance["thread"] = dict(instance["thread"])
+        if qty > 1:
+            instance["quantity"] = 1
+        instance["_original_quantity"] = qty
+        expanded.extend([instance] * qty)
 
     return expanded
 
@@ -72,7 +69,9 @@ def expand_sw_features(features: List[SwFeature]) -> List[SwFeature]:
     Expand SolidWorks features by their quantity/instanceCount.
 
     A feature with quantity=4 becomes 4 individual SwFeature objects,
-    each with quantity=1.
+    each with quantity=1 and an indexed location. All other fields,
+    including thread, raw_data and the spatial fields, are carried over
+    by reference.
 
     Args:
         features: List of SwFeature objects
@@ -97,18 +96,11 @@ def expand_sw_features(features: List[SwFeature]) -> List[SwFeature]:
             expanded.append(feat)
         else:
             for i in range(qty):
-                instance = SwFeature(
-                    feature_type=feat.feature_type,
-                    diameter_inches=feat.diameter_inches,
-                    depth_inches=feat.depth_inches,
-                    radius_inches=feat.radius_inches,
-                    thread=deepcopy(feat.thread) if feat.thread else None,
+                expanded.append(replace(
+                    feat,
                     quantity=1,
                     location=f"{feat.location}[{i}]" if feat.location else f"instance_{i}",
-                    raw_data=feat.raw_data,
-                    source=feat.source,
-                )
-                expanded.append(instance)
+                ))
 
     return expanded
 
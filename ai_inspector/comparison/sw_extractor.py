@@ -27,8 +27,32 @@ import re
 # Conversion factor: meters to inches
 METERS_TO_INCHES = 39.3701
 
-
-@dataclass
+# Thread specification pattern (see SwFeatureExtractor._parse_thread_spec),
+# one alternation tried in priority order with .match():
+# - metric anywhere in the string (lookahead): M6x1.0, M10X1.5
+# - imperial fraction at the start: 1/2-13, 3/8-16
+# - decimal imperial at the start: .500-13, 0.375-16
+_THREAD_RE = re.compile(
+    r"(?=(?s:.*?)M(?P<md>\d+(?:\.\d+)?)\s*[xX]\s*(?P<mp>\d+(?:\.\d+)?))"
+    r"|(?P<ifr>\d+/\d+)\s*-\s*(?P<itpi>\d+)"
+    r"|(?P<dd>\.?\d+\.?\d*)\s*-\s*(?P<dtpi>\d+)\s*(?P<cls>UNC|UNF)?"
+)
+
+# SI marker in units.internalSystem: "SI" as written, "meter" in any case
+_SI_UNITS_RE = re.compile(r"SI|(?i:meter)")
+
+# Candidate JSON keys per dimension, in priority order (see _get_dimension)
+_HOLE_DIAMETER_KEYS = ("diameter", "dia", "d", "size")
+_HOLE_DEPTH_KEYS = ("depth", "dp", "length")
+_HOLE_WIZARD_DIAMETER_KEYS = ("diameter", "holeDiameter", "size")
+_HOLE_WIZARD_DEPTH_KEYS = ("depth", "holeDepth")
+_THREAD_DIAMETER_KEYS = ("diameter", "majorDiameter", "nominalDia")
+_THREAD_DEPTH_KEYS = ("depth", "threadDepth")
+_FILLET_RADIUS_KEYS = ("radius", "r", "filletRadius")
+_CHAMFER_DISTANCE_KEYS = ("distance", "d1", "chamferDistance")
+
+
+@dataclass(slots=True)
 class SwFeature:
     """
     A feature extracted from SolidWorks JSON for comparison.
@@ -41,7 +65,8 @@ class SwFeature:
         thread: Thread specification dict (for tapped holes)
         quantity: Number of instances
         location: Feature location description
-        raw_data: Original SolidWorks feature data
+        raw_data: Original SolidWorks feature data (empty unless the
+            extractor was created with keep_raw=True)
         source: Always "solidworks"
     """
 
@@ -108,13 +133,26 @@ class SwFeatureExtractor:
     """
 
     # SolidWorks feature type mappings
-    HOLE_TYPES = ["HoleWizard", "Hole", "Cut-Extrude", "CutExtrude"]
-    FILLET_TYPES = ["Fillet", "ConstRadiusFillet", "VariableRadiusFillet"]
-    CHAMFER_TYPES = ["Chamfer"]
+    HOLE_TYPES = frozenset({"HoleWizard", "Hole", "Cut-Extrude", "CutExtrude"})
+    FILLET_TYPES = frozenset({"Fillet", "ConstRadiusFillet", "VariableRadiusFillet"})
+    CHAMFER_TYPES = frozenset({"Chamfer"})
+
+    def __init__(self, keep_raw: bool = False):
+        """Initialize extractor.
 
-    def __init__(self):
-        """Initialize extractor."""
-        pass
+        Args:
+            keep_raw: Store each source JSON dict on SwFeature.raw_data. Off by
+                default so extracted features do not keep the parsed JSON alive.
+        """
+        self.keep_raw = keep_raw
+        # Flat-list feature type -> handler, one lookup per feature
+        self._dispatch = {}
+        for types, handler in (
+            (self.HOLE_TYPES, self._extract_hole),
+            (self.FILLET_TYPES, self._extract_fillet),
+            (self.CHAMFER_TYPES, self._extract_chamfer),
+        ):
+            self._dispatch.update(dict.fromkeys(types, handler))
 
     def extract(self, sw_data: Dict[str, Any]) -> List[SwFeature]:
         """
@@ -132,62 +170,41 @@ class SwFeatureExtractor:
         Returns:
             List of SwFeature objects
         """
-        features = []
+        features: List[SwFeature] = []
         features_section = sw_data.get("features", {})
 
-        # Detect if units are SI (meters) - VBA extractor uses SI internally
-        is_si_units = self._detect_si_units(sw_data)
+        # Detect if units are SI (meters) - VBA extractor uses SI internally.
+        # Dimensions are scaled by this factor as they are read.
+        factor = METERS_TO_INCHES if self._detect_si_units(sw_data) else 1.0
 
         # Handle nested structure (from VBA extractor)
         if isinstance(features_section, dict):
-            # Extract from holeWizardHoles array (skip suppressed)
-            for hole in features_section.get("holeWizardHoles", []):
-                if hole.get("isSuppressed", False):
-                    continue
-                extracted = self._extract_hole_wizard(hole, is_si_units)
-                if extracted:
-                    features.append(extracted)
-
-            # Extract from fillets array (skip suppressed)
-            for fillet in features_section.get("fillets", []):
-                if fillet.get("isSuppressed", False):
-                    continue
-                extracted = self._extract_fillet(fillet, is_si_units)
-                if extracted:
-                    features.append(extracted)
-
-            # Extract from chamfers array (skip suppressed)
-            for chamfer in features_section.get("chamfers", []):
-                if chamfer.get("isSuppressed", False):
-                    continue
-                extracted = self._extract_chamfer(chamfer, is_si_units)
-                if extracted:
-                    features.append(extracted)
+            # holeWizardHoles / fillets / chamfers arrays (skip suppressed)
+            for key, handler in (
+                ("holeWizardHoles", self._extract_hole_wizard),
+                ("fillets", self._extract_fillet),
+                ("chamfers", self._extract_chamfer),
+            ):
+                features.extend(filter(None, [
+                    handler(item, factor) for item in features_section.get(key, [])
+                    if not item.get("isSuppressed", False)
+                ]))
 
         # Handle flat list structure
         elif isinstance(features_section, list):
-            for feat in features_section:
-                extracted = self._extract_feature(feat, is_si_units)
-                if extracted:
-                    features.append(extracted)
-
-        # Extract from top-level threads array (separate in some SW exports)
-        for thread in sw_data.get("threads", []):
-            extracted = self._extract_thread(thread, is_si_units)
-            if extracted:
-                features.append(extracted)
-
-        # Extract from top-level holeWizard array (if separate)
-        for hole in sw_data.get("holeWizard", []):
-            extracted = self._extract_hole_wizard(hole, is_si_units)
-            if extracted:
-                features.append(extracted)
-
-        # Extract from top-level fillets array (if separate)
-        for fillet in sw_data.get("fillets", []):
-            extracted = self._extract_fillet(fillet, is_si_units)
-            if extracted:
-                features.append(extracted)
+            features.extend(filter(None, [
+                self._extract_feature(feat, factor) for feat in features_section
+            ]))
+
+        # Top-level threads / holeWizard / fillets arrays (separate in some SW exports)
+        for key, handler in (
+            ("threads", self._extract_thread),
+            ("holeWizard", self._extract_hole_wizard),
+            ("fillets", self._extract_fillet),
+        ):
+            features.extend(filter(None, [
+                handler(item, factor) for item in sw_data.get(key, [])
+            ]))
 
         # Fallback: extract from comparison section if no hole features found
         hole_count = sum(1 for f in features if f.feature_type in ("Hole", "TappedHole"))
@@ -236,7 +253,7 @@ class SwFeatureExtractor:
                 thread=thread,
                 quantity=group.get("count", 1),
                 location=group.get("groupId", ""),
-                raw_data=group,
+                raw_data=group if self.keep_raw else {},
             ))
 
         return results
@@ -249,18 +266,12 @@ class SwFeatureExtractor:
         """
         units = sw_data.get("units", {})
 
-        # Check internalSystem field
-        internal = units.get("internalSystem", "")
-        if "SI" in internal or "meter" in internal.lower():
+        # Check internalSystem field. This also covers IPS documents
+        # (docUnitSystem == "IPS"), whose internal values may still be SI.
+        internal = units.get("internalSystem")
+        if internal and _SI_UNITS_RE.search(internal):
             return True
 
-        # Check for explicit SI indicator
-        if units.get("docUnitSystem") == "IPS":
-            # IPS = Inch-Pound-Second, but internal values may still be SI
-            internal = units.get("internalSystem", "")
-            if "SI" in internal:
-                return True
-
         # Heuristic: if diameter values are very small (< 0.1), probably meters
         features = sw_data.get("features", {})
         if isinstance(features, dict):
@@ -272,35 +283,20 @@ class SwFeatureExtractor:
 
         return False
 
-    def _to_inches(self, value: float, is_si: bool) -> float:
-        """Convert value to inches if in SI units."""
-        if is_si and value is not None:
-            return value * METERS_TO_INCHES
-        return value
-
-    def _extract_feature(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_feature(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """Extract from generic feature dict."""
         feat_type = feat.get("type", feat.get("featureType", ""))
 
-        if feat_type in self.HOLE_TYPES:
-            return self._extract_hole(feat, is_si)
-        elif feat_type in self.FILLET_TYPES:
-            return self._extract_fillet(feat, is_si)
-        elif feat_type in self.CHAMFER_TYPES:
-            return self._extract_chamfer(feat, is_si)
-
-        return None
+        handler = self._dispatch.get(feat_type)
+        return handler(feat, factor) if handler else None
 
-    def _extract_hole(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_hole(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """Extract hole feature."""
-        diameter = self._get_dimension(feat, ["diameter", "dia", "d", "size"])
+        diameter = self._get_dimension(feat, _HOLE_DIAMETER_KEYS, factor)
         if diameter is None:
             return None
 
-        diameter = self._to_inches(diameter, is_si)
-        depth = self._get_dimension(feat, ["depth", "dp", "length"])
-        if depth:
-            depth = self._to_inches(depth, is_si)
+        depth = self._get_dimension(feat, _HOLE_DEPTH_KEYS, factor)
 
         is_through = feat.get("isThrough", feat.get("thru", False))
 
@@ -314,10 +310,10 @@ class SwFeatureExtractor:
             thread=thread,
             quantity=feat.get("quantity", feat.get("count", 1)),
             location=feat.get("location", ""),
-            raw_data=feat,
+            raw_data=feat if self.keep_raw else {},
         )
 
-    def _extract_hole_wizard(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_hole_wizard(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """
         Extract HoleWizard feature from VBA extractor format.
 
@@ -328,15 +324,11 @@ class SwFeatureExtractor:
         - isThrough: Boolean
         - instanceCount: Number of instances
         """
-        diameter = self._get_dimension(feat, ["diameter", "holeDiameter", "size"])
+        diameter = self._get_dimension(feat, _HOLE_WIZARD_DIAMETER_KEYS, factor)
         if diameter is None:
             return None
 
-        diameter = self._to_inches(diameter, is_si)
-
-        depth = self._get_dimension(feat, ["depth", "holeDepth"])
-        if depth:
-            depth = self._to_inches(depth, is_si)
+        depth = self._get_dimension(feat, _HOLE_WIZARD_DEPTH_KEYS, factor)
 
         # Check for through hole
         is_through = (
@@ -361,10 +353,10 @@ class SwFeatureExtractor:
             thread=thread,
             quantity=feat.get("instanceCount", feat.get("quantity", 1)),
             location=feat.get("location", feat.get("name", "")),
-            raw_data=feat,
+            raw_data=feat if self.keep_raw else {},
         )
 
-    def _extract_thread(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_thread(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """Extract thread from threads array."""
         thread_type = feat.get("type", feat.get("threadType", ""))
 
@@ -376,13 +368,8 @@ class SwFeatureExtractor:
                 "standard": "Unknown",
             }
 
-        diameter = self._get_dimension(feat, ["diameter", "majorDiameter", "nominalDia"])
-        if diameter:
-            diameter = self._to_inches(diameter, is_si)
-
-        depth = self._get_dimension(feat, ["depth", "threadDepth"])
-        if depth:
-            depth = self._to_inches(depth, is_si)
+        diameter = self._get_dimension(feat, _THREAD_DIAMETER_KEYS, factor)
+        depth = self._get_dimension(feat, _THREAD_DEPTH_KEYS, factor)
 
         return SwFeature(
             feature_type="TappedHole",
@@ -391,39 +378,35 @@ class SwFeatureExtractor:
             thread=thread_info,
             quantity=feat.get("quantity", 1),
             location=feat.get("location", ""),
-            raw_data=feat,
+            raw_data=feat if self.keep_raw else {},
         )
 
-    def _extract_fillet(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_fillet(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """Extract fillet feature."""
-        radius = self._get_dimension(feat, ["radius", "r", "filletRadius"])
+        radius = self._get_dimension(feat, _FILLET_RADIUS_KEYS, factor)
         if radius is None:
             return None
 
-        radius = self._to_inches(radius, is_si)
-
         return SwFeature(
             feature_type="Fillet",
             radius_inches=radius,
             quantity=feat.get("edgeCount", feat.get("quantity", 1)),
             location=feat.get("location", feat.get("name", "")),
-            raw_data=feat,
+            raw_data=feat if self.keep_raw else {},
         )
 
-    def _extract_chamfer(self, feat: Dict[str, Any], is_si: bool) -> Optional[SwFeature]:
+    def _extract_chamfer(self, feat: Dict[str, Any], factor: float) -> Optional[SwFeature]:
         """Extract chamfer feature."""
-        distance = self._get_dimension(feat, ["distance", "d1", "chamferDistance"])
+        distance = self._get_dimension(feat, _CHAMFER_DISTANCE_KEYS, factor)
         if distance is None:
             return None
 
-        distance = self._to_inches(distance, is_si)
-
         return SwFeature(
             feature_type="Chamfer",
             radius_inches=distance,  # Using radius field for chamfer distance
             quantity=feat.get("edgeCount", feat.get("quantity", 1)),
             location=feat.get("location", feat.get("name", "")),
-            raw_data=feat,
+            raw_data=feat if self.keep_raw else {},
         )
 
     def _extract_thread_info(self, feat: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -450,46 +433,61 @@ class SwFeatureExtractor:
         if not spec:
             return None
 
+        # Fast reject before any regex work (e.g. feature names like
+        # "Fillet1"): metric needs an "M", the other forms start with a digit
+        # or "." and contain a "-"
+        if "M" not in spec and (
+            "-" not in spec or not (spec[0] == "." or spec[0].isdigit())
+        ):
+            return {"standard": "Unknown", "raw": spec}
+
+        m = _THREAD_RE.match(spec)
+        if m is None:
+            return {"standard": "Unknown", "raw": spec}
+
         # Metric: M6x1.0, M10X1.5
-        metric_match = re.search(r"M(\d+(?:\.\d+)?)\s*[xX]\s*(\d+(?:\.\d+)?)", spec)
-        if metric_match:
+        if m.group("md") is not None:
             return {
                 "standard": "Metric",
-                "nominalDiameterMm": float(metric_match.group(1)),
-                "pitch": float(metric_match.group(2)),
+                "nominalDiameterMm": float(m.group("md")),
+                "pitch": float(m.group("mp")),
                 "raw": spec,
             }
 
         # Imperial fraction: 1/2-13, 3/8-16
-        imperial_match = re.match(r"(\d+/\d+)\s*-\s*(\d+)", spec)
-        if imperial_match:
+        if m.group("ifr") is not None:
             return {
                 "standard": "Imperial",
-                "fraction": imperial_match.group(1),
-                "tpi": int(imperial_match.group(2)),
+                "fraction": m.group("ifr"),
+                "tpi": int(m.group("itpi")),
                 "raw": spec,
             }
 
         # Decimal imperial: .500-13, 0.375-16
-        decimal_match = re.match(r"(\.?\d+\.?\d*)\s*-\s*(\d+)\s*(UNC|UNF)?", spec)
-        if decimal_match:
-            return {
-                "standard": "Unified",
-                "nominalDiameterInches": float(decimal_match.group(1)),
-                "tpi": int(decimal_match.group(2)),
-                "threadClass": decimal_match.group(3) or "UNC",
-                "raw": spec,
-            }
-
-        return {"standard": "Unknown", "raw": spec}
+        return {
+            "standard": "Unified",
+            "nominalDiameterInches": float(m.group("dd")),
+            "tpi": int(m.group("dtpi")),
+            "threadClass": m.group("cls") or "UNC",
+            "raw": spec,
+        }
 
-    def _get_dimension(self, feat: Dict[str, Any], keys: List[str]) -> Optional[float]:
-        """Get dimension value from feature, trying multiple key names."""
+    def _get_dimension(
+        self,
+        feat: Dict[str, Any],
+        keys: Tuple[str, ...],
+        factor: float,
+    ) -> Optional[float]:
+        """Get dimension value from feature, trying multiple key names in order.
+
+        The value is scaled by factor (METERS_TO_INCHES for SI documents,
+        1.0 otherwise) so callers get inches directly.
+        """
         for key in keys:
             val = feat.get(key)
             if val is not None:
                 try:
-                    return float(val)
+                    return float(val) * factor
                 except (ValueError, TypeError):
                     continue
         return None
@@ -15,10 +15,10 @@ Usage:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Central configuration for the AI Inspector pipeline.
@@ -65,6 +65,8 @@ class Config:
     # === YOLO Detection ===
     yolo_model_path: str = "hf://shadrack20s/ai-inspector-callout-detection/callout_v2_yolo11s-obb_best.pt"
     yolo_confidence_threshold: float = 0.25    # YOLO detection confidence threshold
+    yolo_precision: str = "fp32"               # "fp16"/"int8" export TensorRT (CUDA) or OpenVINO (CPU)
+    yolo_calibration_data: Optional[str] = None  # Dataset YAML for int8 calibration
     # Optional per-class post-filter thresholds. Used after global threshold.
     # Keep Fillet stricter to suppress common false positives.
     yolo_class_confidence_thresholds: Dict[str, float] = field(
@@ -4,17 +4,29 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     """Output from YOLO-OBB detector."""
     class_name: str
     confidence: float
-    obb_points: List[List[float]]  # 4x2 array [[x,y], [x,y], [x,y], [x,y]]
-    xywhr: Optional[List[float]] = None
+    obb_points: Any  # float32 np.ndarray, shape (4, 2): [[x,y], [x,y], [x,y], [x,y]]
+    xywhr: Any = None  # Optional float32 np.ndarray, shape (5,): [cx, cy, w, h, r]
     det_id: str = ""
 
+    def obb_points_as_list(self) -> List[List[float]]:
+        """Corner points as nested Python lists (for JSON output)."""
+        if hasattr(self.obb_points, "tolist"):
+            return self.obb_points.tolist()
+        return [list(p) for p in self.obb_points]
 
-@dataclass
+    def xywhr_as_list(self) -> Optional[List[float]]:
+        """xywhr as a Python list (for JSON output), or None."""
+        if self.xywhr is None or not hasattr(self.xywhr, "tolist"):
+            return self.xywhr
+        return self.xywhr.tolist()
+
+
+@dataclass(slots=True)
 class CropResult:
     """Output from OBB cropper."""
     image: Any  # PIL.Image (Any to avoid import issues)
@@ -22,7 +34,7 @@ class CropResult:
     # meta includes: pad_ratio, crop_w, crop_h, det_id
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Output from OCR adapter."""
     text: str
@@ -30,7 +42,7 @@ class OCRResult:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RotationResult:
     """Output from rotation selector."""
     raw: str
@@ -39,7 +51,7 @@ class RotationResult:
     ocr_result: Optional[OCRResult] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReaderResult:
     """Output from crop reader (pre-validation)."""
     callout_type: str
@@ -49,7 +61,7 @@ class ReaderResult:
     ocr_confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CalloutPacket:
     """Full provenance packet tracking a detection through the pipeline."""
     det_id: str
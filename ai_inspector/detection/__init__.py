@@ -2,8 +2,8 @@
 
 from ..contracts import DetectionResult
 from .classes import (
-    YOLO_CLASSES, IDX_TO_CLASS, CLASS_TO_IDX, NUM_CLASSES,
-    CLASS_TO_CALLOUT_TYPE, FUTURE_TYPES,
+    YOLO_CLASSES, IDX_TO_CLASS, IDX_TO_CLASS_TUPLE, CLASS_TO_IDX, NUM_CLASSES,
+    CLASS_TO_CALLOUT_TYPE, FUTURE_TYPES, FUTURE_TYPE_MASK,
     FINETUNED_CLASSES, FINETUNED_IDX_TO_CLASS, FINETUNED_NUM_CLASSES,
 )
 from .yolo_detector import YOLODetector
@@ -13,10 +13,12 @@ __all__ = [
     "YOLODetector",
     "YOLO_CLASSES",
     "IDX_TO_CLASS",
+    "IDX_TO_CLASS_TUPLE",
     "CLASS_TO_IDX",
     "NUM_CLASSES",
     "CLASS_TO_CALLOUT_TYPE",
     "FUTURE_TYPES",
+    "FUTURE_TYPE_MASK",
     "FINETUNED_CLASSES",
     "FINETUNED_IDX_TO_CLASS",
     "FINETUNED_NUM_CLASSES",
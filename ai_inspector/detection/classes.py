@@ -1,8 +1,8 @@
 """YOLO-OBB class definitions for engineering drawing callout detection."""
 
 # Class names in order matching YOLO model training
-# This is the SINGLE SOURCE OF TRUTH for class names
-YOLO_CLASSES = [
+# This is the SINGLE SOURCE OF TRUTH for class names (immutable)
+YOLO_CLASSES = (
     "Hole",
     "TappedHole",
     "CounterboreHole",
@@ -17,10 +17,12 @@ YOLO_CLASSES = [
     "Dimension",
     "Tolerance",
     "Note",
-]
+)
 
 # Mapping from class index to name
 IDX_TO_CLASS = {i: name for i, name in enumerate(YOLO_CLASSES)}
+# Same mapping as a table: ids are contiguous from 0, so index directly
+IDX_TO_CLASS_TUPLE = YOLO_CLASSES
 CLASS_TO_IDX = {name: i for i, name in enumerate(YOLO_CLASSES)}
 
 # Number of classes (full 14-class list)
@@ -34,29 +36,19 @@ FINETUNED_CLASSES = ["Hole", "TappedHole", "Fillet", "Chamfer"]
 FINETUNED_IDX_TO_CLASS = {i: name for i, name in enumerate(FINETUNED_CLASSES)}
 FINETUNED_NUM_CLASSES = len(FINETUNED_CLASSES)
 
-# Classes that map to specific callout types for the parser
-CLASS_TO_CALLOUT_TYPE = {
-    "Hole": "Hole",
-    "TappedHole": "TappedHole",
-    "CounterboreHole": "CounterboreHole",
-    "CountersinkHole": "CountersinkHole",
-    "Fillet": "Fillet",
-    "Chamfer": "Chamfer",
-    "Thread": "Thread",
-    "Slot": "Slot",
-    "Bend": "Bend",
-    "GDT": "GDT",
-    "SurfaceFinish": "SurfaceFinish",
-    "Dimension": "Dimension",
-    "Tolerance": "Tolerance",
-    "Note": "Note",
-}
+# Classes that map to specific callout types for the parser.
+# Every class is currently its own callout type; keep this a separate table
+# so a class can be remapped without touching the parser.
+CLASS_TO_CALLOUT_TYPE = dict(zip(YOLO_CLASSES, YOLO_CLASSES))
 
 # Classes that the matcher should SKIP (not penalize).
 # Includes types not yet implemented in matcher._match_by_type().
-FUTURE_TYPES = {
+FUTURE_TYPES = frozenset({
     "Slot", "Bend", "Note",                      # Not matchable
     "CounterboreHole", "CountersinkHole",         # Matching not yet implemented
     "Thread",                                      # Matched via TappedHole only
     "GDT", "SurfaceFinish", "Dimension", "Tolerance",  # Info-only types
-}
+})
+
+# FUTURE_TYPES membership by class index, for callers holding a cls_id
+FUTURE_TYPE_MASK = tuple(name in FUTURE_TYPES for name in YOLO_CLASSES)
@@ -1,15 +1,34 @@
 """YOLO11-OBB detector for engineering drawing callouts."""
 
+import heapq
 import logging
 import os
+import re
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from ..contracts import DetectionResult
-from .classes import IDX_TO_CLASS, FINETUNED_IDX_TO_CLASS
+from .classes import IDX_TO_CLASS_TUPLE, FINETUNED_IDX_TO_CLASS
 
 logger = logging.getLogger(__name__)
 
+# Inference precisions accepted by YOLODetector
+PRECISIONS = ("fp32", "fp16", "int8")
+
+# Name ultralytics gives each export next to <stem>.pt; other formats
+# are assumed to use ".<format>"
+_EXPORT_SUFFIXES = {
+    "engine": ".engine",
+    "openvino": "_openvino_model",
+    "onnx": ".onnx",
+}
+
+# hf://user/repo/filename -> ("user/repo", "filename"); the filename may
+# contain further "/" (hf://user/repo/sub/dir/filename)
+_HF_URI_RE = re.compile(r"^hf://([^/]+/[^/]+)/(.+)$")
+
 
 class YOLODetector:
     """
@@ -30,19 +49,51 @@ class YOLODetector:
         confidence_threshold: float = 0.25,
         device: Optional[str] = None,
         hf_token: Optional[str] = None,
+        precision: str = "fp32",
+        export_format: Optional[str] = None,
+        calibration_data: Optional[str] = None,
+        max_batch: int = 8,
+        imgsz: int = 640,
+        include_xywhr: bool = True,
     ):
         # Preserve URI schemes (e.g. hf://) as raw strings.
         # Path() on Windows would corrupt "hf://user/repo" into "hf:/user/repo".
-        path_str = str(model_path)
+        path_str = os.fspath(model_path)
         if "://" in path_str:
             self.model_path: Union[str, Path] = path_str
+        elif isinstance(model_path, Path):
+            self.model_path = model_path
         else:
-            self.model_path = Path(model_path)
+            self.model_path = Path(path_str)
 
         self.confidence_threshold = confidence_threshold
         self.device = device
         self.hf_token = hf_token
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"precision must be one of {PRECISIONS}, got '{precision}'"
+            )
+        self.precision = precision
+        # FP16 inference; ultralytics only honours it on CUDA devices
+        self.half = precision == "fp16"
+        # "engine" (TensorRT), "openvino" or "onnx": export .pt weights once
+        # on load(). Defaults for fp16/int8 to "openvino" on device "cpu",
+        # else to "engine" when CUDA is available (OpenVINO on CPU-only
+        # hosts).
+        self.export_format = export_format
+        # Dataset YAML used to calibrate an int8 export (an OpenVINO export
+        # without one falls back to FP32)
+        self.calibration_data = calibration_data
+        # Images per forward pass in detect_batch (and the engine's max batch)
+        self.max_batch = max_batch
+        # Side of the dummy image run through the model by load() on CUDA
+        self.imgsz = imgsz
+        # Copy the xywhr boxes to the host; when False every
+        # DetectionResult.xywhr is None
+        self.include_xywhr = include_xywhr
         self.model = None
+        # Class names indexed by class id, built in load()
+        self._class_names: List[str] = []
 
     def load(self) -> None:
         """Load the YOLO model.
@@ -58,6 +109,24 @@ class YOLODetector:
         environment variable **and** forwarded to ``hf_hub_download`` for
         authenticated access.
 
+        A ``.pt`` checkpoint is exported when *export_format* is set -- or
+        *precision* is fp16/int8, which selects OpenVINO for device "cpu" or
+        a CPU-only host and a TensorRT engine otherwise.  The export is
+        cached next to the checkpoint (``.engine``, a
+        ``<stem>_openvino_model`` directory or ``.onnx``) and loaded in its
+        place on later loads while it is not older than the checkpoint;
+        fp32 without *export_format* always runs the checkpoint itself.
+        A cached export is reused whatever precision it was built at,
+        and a TensorRT engine is specific to the GPU, driver and TensorRT
+        version that built it: delete the ``.engine`` file (or the OpenVINO
+        directory) to regenerate it after changing precision, hardware or
+        driver.
+
+        On CUDA, TF32 matmuls and cuDNN autotuning are enabled and one
+        dummy *imgsz* x *imgsz* image is run through the model, so CUDA
+        context setup and kernel selection happen here rather than in the
+        first detect() call.
+
         Raises:
             RuntimeError: If the model cannot be loaded (file not found,
                 download failure, etc.).
@@ -76,6 +145,16 @@ class YOLODetector:
         if resolved_path.startswith("hf://"):
             resolved_path = self._download_hf_model(resolved_path)
 
+        exported_path = None
+        if resolved_path.endswith(".pt"):
+            export_format = self._resolve_export_format()
+            if export_format:
+                exported_path = self._find_exported_model(resolved_path, export_format)
+                if exported_path is None:
+                    exported_path = self._export_model(YOLO, resolved_path, export_format)
+        if exported_path is not None:
+            resolved_path = exported_path
+
         try:
             self.model = YOLO(resolved_path)
         except Exception as exc:
@@ -83,9 +162,13 @@ class YOLODetector:
                 f"Failed to load YOLO model from '{self.model_path}': {exc}"
             ) from exc
 
-        if self.device:
+        # Exported backends are placed on the device at predict time
+        if self.device and exported_path is None:
             self.model.to(self.device)
 
+        self._class_names = self._build_class_names()
+        self._warmup()
+
         logger.info(
             "YOLO model loaded from '%s' with %d classes: %s",
             self.model_path,
@@ -93,6 +176,151 @@ class YOLODetector:
             self.model.names,
         )
 
+    @staticmethod
+    def _find_exported_model(weights_path: str, export_format: str) -> Optional[str]:
+        """Return the cached export of a .pt checkpoint, if one exists.
+
+        Exports older than the checkpoint are ignored as stale.
+
+        Args:
+            weights_path: Local path to the model weights
+            export_format: Ultralytics export format to look for
+
+        Returns:
+            Path to the export (e.g. .engine file or OpenVINO directory)
+            next to the checkpoint, or None
+        """
+        path = Path(weights_path)
+        if path.suffix != ".pt":
+            return None
+        suffix = _EXPORT_SUFFIXES.get(export_format, f".{export_format}")
+        candidate = path.with_name(path.stem + suffix)
+        if not candidate.exists():
+            return None
+        weights_mtime = path.stat().st_mtime if path.is_file() else 0.0
+        if candidate.stat().st_mtime < weights_mtime:
+            return None
+        return str(candidate)
+
+    def _warmup(self) -> None:
+        """Tune torch for CUDA and run one dummy forward pass.
+
+        Warmup failures are only logged.
+        """
+        if not self._may_use_cuda():
+            return
+        try:
+            import torch
+        except ImportError:
+            return
+        if not torch.cuda.is_available():
+            return
+        import numpy as np
+
+        torch.backends.cudnn.benchmark = True
+        torch.set_float32_matmul_precision("high")
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        try:
+            with torch.inference_mode():
+                self.model(
+                    dummy,
+                    conf=self.confidence_threshold,
+                    half=self.half,
+                    device=self.device,
+                    verbose=False,
+                )
+        except Exception as exc:
+            logger.warning("Model warmup failed: %s", exc)
+
+    def _may_use_cuda(self) -> bool:
+        """Whether self.device is None (auto), "cuda", "cuda:N" or a CUDA index."""
+        device = "cuda" if self.device is None else str(self.device)
+        return device.startswith("cuda") or device.isdigit()
+
+    def _resolve_export_format(self) -> Optional[str]:
+        """Pick the export format for load(), or None to run the .pt weights."""
+        if self.export_format:
+            return self.export_format
+        if self.precision == "fp32":
+            return None
+        # An explicit CPU device never gets a (GPU-only) TensorRT engine
+        if self.device == "cpu":
+            return "openvino"
+        if not self._may_use_cuda():
+            return None
+        try:
+            import torch
+        except ImportError:
+            return None
+        if torch.cuda.is_available():
+            return "engine"
+        # Auto device on a CPU-only host: OpenVINO runs the export on the CPU
+        return "openvino" if self.device is None else None
+
+    def _export_model(self, yolo_cls, weights_path: str, export_format: str) -> Optional[str]:
+        """Export a .pt checkpoint at self.precision.
+
+        Args:
+            yolo_cls: The ultralytics YOLO class
+            weights_path: Local path to the .pt checkpoint
+            export_format: Ultralytics export format ("engine", "openvino"
+                or "onnx")
+
+        Returns:
+            Path to the exported model, or None if the export failed (the
+            checkpoint is then loaded as usual)
+        """
+        kwargs = {
+            "format": export_format,
+            "half": self.half,
+            "dynamic": True,
+            "batch": self.max_batch,
+            "device": self.device,
+        }
+        if self.precision == "int8":
+            if export_format == "openvino" and not self.calibration_data:
+                logger.warning(
+                    "No calibration_data for an int8 OpenVINO export; "
+                    "exporting at FP32"
+                )
+            else:
+                kwargs["int8"] = True
+                if self.calibration_data:
+                    kwargs["data"] = self.calibration_data
+
+        logger.info(
+            "Exporting '%s' to %s (%s)", weights_path, export_format, self.precision
+        )
+        try:
+            exported = yolo_cls(weights_path).export(**kwargs)
+        except Exception as exc:
+            logger.warning(
+                "Export to %s failed, using PyTorch weights: %s",
+                export_format,
+                exc,
+            )
+            return None
+        return str(exported)
+
+    def _build_class_names(self) -> List[str]:
+        """Build the class-id-to-name table used by detect().
+
+        Prefers the authoritative model.names dict that ultralytics exposes
+        (it reflects the exact classes the model was trained on), falling
+        back to the hardcoded IDX_TO_CLASS only if model.names is
+        unavailable.  Gaps in the id range are filled with "Unknown_<id>".
+        """
+        idx_to_name = getattr(self.model, "names", None)
+        if not idx_to_name:
+            logger.warning(
+                "model.names unavailable; falling back to hardcoded IDX_TO_CLASS"
+            )
+            return list(IDX_TO_CLASS_TUPLE)
+        return [
+            idx_to_name.get(i, f"Unknown_{i}")
+            for i in range(max(idx_to_name) + 1)
+        ]
+
     def _download_hf_model(self, hf_uri: str) -> str:
         """Download a model from HuggingFace Hub and return the local path.
 
@@ -112,20 +340,13 @@ class YOLODetector:
         """
         from huggingface_hub import hf_hub_download  # lazy import
 
-        # Strip the "hf://" prefix and split into components.
-        # Expected format after stripping: "user/repo/filename"
-        # which may also be "user/repo/sub/dir/filename".
-        stripped = hf_uri[len("hf://"):]
-        parts = stripped.split("/")
-
-        if len(parts) < 3:
+        match = _HF_URI_RE.match(hf_uri)
+        if match is None:
             raise RuntimeError(
                 f"Invalid hf:// URI '{hf_uri}'. "
                 "Expected format: hf://user/repo/filename"
             )
-
-        repo_id = f"{parts[0]}/{parts[1]}"
-        filename = "/".join(parts[2:])
+        repo_id, filename = match.groups()
 
         logger.info(
             "Downloading HuggingFace model: repo_id='%s', filename='%s'",
@@ -153,6 +374,7 @@ class YOLODetector:
         if self.model is not None:
             del self.model
             self.model = None
+            self._class_names = []
 
     @property
     def is_loaded(self) -> bool:
@@ -163,6 +385,7 @@ class YOLODetector:
         image,  # PIL.Image or numpy array or file path
         page_id: str = "page_0",
         confidence_threshold: Optional[float] = None,
+        class_thresholds: Optional[Dict[str, float]] = None,
     ) -> List[DetectionResult]:
         """
         Run detection on a single image.
@@ -171,64 +394,163 @@ class YOLODetector:
             image: Input image (PIL Image, numpy array, or file path)
             page_id: Identifier for this page (used in det_id)
             confidence_threshold: Override default threshold
+            class_thresholds: Optional per-class minimum confidence applied
+                on top of the global threshold (classes not listed are kept)
 
         Returns:
             List of DetectionResult sorted by confidence descending
         """
+        return list(
+            self.iter_detections(image, page_id, confidence_threshold, class_thresholds)
+        )
+
+    def iter_detections(
+        self,
+        image,  # PIL.Image or numpy array or file path
+        page_id: str = "page_0",
+        confidence_threshold: Optional[float] = None,
+        class_thresholds: Optional[Dict[str, float]] = None,
+        top_k: Optional[int] = None,
+    ) -> Iterator[DetectionResult]:
+        """
+        Run detection on a single image and yield results lazily.
+
+        Inference runs immediately; DetectionResults are only built as the
+        iterator is consumed, so callers that stop early (or pass top_k)
+        skip constructing the rest.
+
+        Args:
+            image: Input image (PIL Image, numpy array, or file path)
+            page_id: Identifier for this page (used in det_id)
+            confidence_threshold: Override default threshold
+            class_thresholds: Optional per-class minimum confidence applied
+                on top of the global threshold (classes not listed are kept)
+            top_k: Yield at most this many detections
+
+        Returns:
+            Iterator of DetectionResult in confidence-descending order
+        """
         if not self.is_loaded:
             raise RuntimeError("Model not loaded. Call load() first.")
 
         conf = confidence_threshold or self.confidence_threshold
+        min_conf = self._class_min_confidence(class_thresholds)
+
+        results = self.model(
+            image, conf=conf, half=self.half, device=self.device, verbose=False
+        )
 
-        # Build the class-index-to-name mapping.
-        # Prefer the authoritative model.names dict that ultralytics exposes
-        # (it reflects the exact classes the model was trained on).  Fall back
-        # to the hardcoded IDX_TO_CLASS only if model.names is unavailable.
-        if hasattr(self.model, "names") and self.model.names:
-            idx_to_name = self.model.names  # dict {int: str}
+        runs = [self._iter_result_detections(r, page_id, min_conf) for r in results]
+        if len(runs) == 1:
+            detections = runs[0]
         else:
-            logger.warning(
-                "model.names unavailable; falling back to hardcoded IDX_TO_CLASS"
+            # Each result is already in confidence order; only several
+            # results (multi-image sources such as a video or a directory)
+            # need merging. heapq.merge keeps earlier results first on ties.
+            detections = heapq.merge(
+                *runs, key=attrgetter("confidence"), reverse=True
             )
-            idx_to_name = IDX_TO_CLASS
 
-        results = self.model(image, conf=conf, verbose=False)
+        if top_k is not None:
+            return islice(detections, top_k)
+        return iter(detections)
 
-        detections = []
-        for result in results:
-            if result.obb is None:
-                continue
+    def _class_min_confidence(self, class_thresholds: Optional[Dict[str, float]]):
+        """
+        Build the per-class-index minimum confidence array.
 
-            obb = result.obb
+        Args:
+            class_thresholds: Class name -> minimum confidence, or None
 
-            for i in range(len(obb)):
-                # Use named attributes -- NOT hardcoded indices
-                cls_id = int(obb.cls[i].item())
-                confidence = float(obb.conf[i].item())
+        Returns:
+            float64 array indexed by class id (-inf for classes without a
+            threshold), or None if there is nothing to filter
+        """
+        if not class_thresholds:
+            return None
 
-                # OBB polygon points (4 corners)
-                # obb.xyxyxyxy gives shape [N, 4, 2]
-                points = obb.xyxyxyxy[i].cpu().numpy().tolist()
+        import numpy as np
 
-                # xywhr format if available
-                xywhr = obb.xywhr[i].cpu().numpy().tolist() if obb.xywhr is not None else None
+        return np.array(
+            [float(class_thresholds.get(name, -np.inf)) for name in self._class_names],
+            dtype=np.float64,
+        )
 
-                # Map class ID to name using the runtime mapping
-                class_name = idx_to_name.get(cls_id, f"Unknown_{cls_id}")
+    def _iter_result_detections(
+        self,
+        result,
+        page_id: str,
+        min_conf=None,
+    ) -> Iterator[DetectionResult]:
+        """
+        Convert one ultralytics result into DetectionResults.
 
-                det = DetectionResult(
-                    class_name=class_name,
-                    confidence=confidence,
-                    obb_points=points,
-                    xywhr=xywhr,
-                    det_id=f"{page_id}_{i}",
-                )
-                detections.append(det)
+        Args:
+            result: A single ultralytics Results object
+            page_id: Identifier for the page (used in det_id)
+            min_conf: Optional per-class minimum confidence array from
+                _class_min_confidence()
 
-        # Sort by confidence descending
-        detections.sort(key=lambda d: d.confidence, reverse=True)
+        Yields:
+            DetectionResult in confidence-descending order
+        """
+        obb = result.obb
+        if obb is None:
+            return
+
+        # Move each tensor to the host once per result rather than once
+        # per detection (every .item()/.cpu() is a device sync on GPU).
+        # Use named attributes -- NOT hardcoded indices
+        cls_arr = obb.cls.cpu().numpy()
+        conf_arr = obb.conf.cpu().numpy()
+        # OBB polygon points (4 corners), shape [N, 4, 2]
+        # Rows are handed out as views, so make sure they are contiguous
+        # (a no-op for the usual freshly stacked tensor)
+        import numpy as np
+
+        pts_arr = np.ascontiguousarray(obb.xyxyxyxy.cpu().numpy())
+        # xywhr format if available and wanted
+        xywhr_arr = (
+            np.ascontiguousarray(obb.xywhr.cpu().numpy())
+            if self.include_xywhr and obb.xywhr is not None
+            else None
+        )
 
-        return detections
+        # Visit detections by descending confidence; the stable sort on
+        # the negated scores keeps tied detections in index order, the
+        # same order list.sort(reverse=True) leaves them in.
+        order = (-conf_arr).argsort(kind="stable")
+        if min_conf is not None and len(order):
+            # Per-class thresholds as one vectorized mask; det_ids keep the
+            # original detection index. Ids outside the table are kept.
+            cls_idx = cls_arr.astype(int)
+            in_table = (cls_idx >= 0) & (cls_idx < len(min_conf))
+            keep = ~in_table | (conf_arr >= min_conf[cls_idx * in_table])
+            order = order[keep[order]]
+        order = order.tolist()
+
+        # Convert the scalar columns to Python lists in one call each;
+        # indexing NumPy arrays element by element boxes a scalar per read.
+        cls_ids = cls_arr.astype(int).tolist()
+        confidences = conf_arr.tolist()
+
+        # Bound once: the loop below runs per detection
+        class_names = self._class_names
+        num_names = len(class_names)
+        prefix = f"{page_id}_"
+        for i in order:
+            cls_id = cls_ids[i]
+            confidence = confidences[i]
+            points = pts_arr[i]
+            xywhr = xywhr_arr[i] if xywhr_arr is not None else None
+
+            # Map class ID to name using the runtime mapping
+            if 0 <= cls_id < num_names:
+                class_name = class_names[cls_id]
+            else:
+                class_name = f"Unknown_{cls_id}"
+
+            yield DetectionResult(class_name, confidence, points, xywhr, prefix + str(i))
 
     def detect_batch(
         self,
@@ -236,7 +558,9 @@ class YOLODetector:
         page_ids: Optional[List[str]] = None,
     ) -> List[List[DetectionResult]]:
         """
-        Run detection on multiple images.
+        Run detection on multiple images in batched forward passes.
+
+        Images are sent to the model max_batch at a time.
 
         Args:
             images: List of input images
@@ -245,13 +569,55 @@ class YOLODetector:
         Returns:
             List of detection lists, one per image
         """
+        return list(self.detect_iter(images, page_ids))
+
+    def detect_iter(
+        self,
+        images: list,
+        page_ids: Optional[List[str]] = None,
+    ) -> Iterator[List[DetectionResult]]:
+        """
+        Run batched detection and yield each page's detections as it is ready.
+
+        Results are streamed from ultralytics one max_batch chunk at a time,
+        so only that chunk's raw result tensors are alive at once, and the
+        caller can consume each page before later chunks are run.
+
+        Args:
+            images: List of input images
+            page_ids: Optional list of page identifiers
+
+        Returns:
+            Iterator of detection lists, one per image
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
         if page_ids is None:
             page_ids = [f"page_{i}" for i in range(len(images))]
 
-        return [
-            self.detect(img, pid)
-            for img, pid in zip(images, page_ids)
-        ]
+        # Only images that have a page id are reported
+        images = list(images[:len(page_ids)])
+        return self._detect_chunks(images, page_ids)
+
+    def _detect_chunks(
+        self,
+        images: list,
+        page_ids: List[str],
+    ) -> Iterator[List[DetectionResult]]:
+        """Yield per-page detections for detect_iter(), max_batch images per call."""
+        step = max(1, self.max_batch)
+        for start in range(0, len(images), step):
+            results = self.model(
+                images[start:start + step],
+                conf=self.confidence_threshold,
+                half=self.half,
+                device=self.device,
+                stream=True,
+                verbose=False,
+            )
+            for result, pid in zip(results, page_ids[start:start + step]):
+                yield list(self._iter_result_detections(result, pid))
 
     def summary(self, detections: List[DetectionResult]) -> dict:
         """
@@ -259,10 +625,14 @@ class YOLODetector:
 
         Returns dict with total count and per-class breakdown.
         """
-        from collections import Counter
-        class_counts = Counter(d.class_name for d in detections)
+        # Single pass over the detections for both the counts and the mean
+        class_counts = {}
+        total_confidence = 0.0
+        for d in detections:
+            total_confidence += d.confidence
+            class_counts[d.class_name] = class_counts.get(d.class_name, 0) + 1
         return {
             "total": len(detections),
-            "by_class": dict(class_counts),
-            "avg_confidence": sum(d.confidence for d in detections) / len(detections) if detections else 0.0,
+            "by_class": class_counts,
+            "avg_confidence": total_confidence / len(detections) if detections else 0.0,
         }
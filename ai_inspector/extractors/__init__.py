@@ -34,10 +34,18 @@ def __getattr__(name):
         module_name, attr_name = _LEGACY_NAMES[name]
         import importlib
         mod = importlib.import_module(f".{module_name}", __package__)
-        return getattr(mod, attr_name)
+        value = getattr(mod, attr_name)
+        # Cache so later lookups bypass __getattr__
+        globals()[name] = value
+        return value
     raise AttributeError(f"module 'ai_inspector.extractors' has no attribute {name!r}")
 
 
+def __dir__():
+    """List lazy names too, for autocompletion."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Legacy v4 pipeline (lazy)
     "LightOnOCR",
@@ -5,6 +5,7 @@ so downstream patterns only need to handle canonical forms.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 
@@ -57,43 +58,89 @@ SYMBOL_MAP: Dict[str, str] = {
     '\u2212': '-',       # Minus sign
 }
 
-# LaTeX notation replacements (LightOnOCR-2 outputs LaTeX for math symbols)
-LATEX_REPLACEMENTS: List[Tuple[str, str]] = [
+
+def _compose_symbol_map(symbol_map: Dict[str, str]) -> Dict[str, str]:
+    """
+    Extend a symbol map so one scan matches replacing its keys in order.
+
+    Replaced one key at a time, an earlier replacement can complete a later
+    key ('Â' + '+/-' -> 'Â±' -> '±'). Each such composition is added as a
+    key of its own.
+    """
+    composed = dict(symbol_map)
+    items = list(symbol_map.items())
+    for i, (key, value) in enumerate(items):
+        for old, new in items[:i]:
+            if new != old and new in key:
+                composed.setdefault(key.replace(new, old), value)
+    return composed
+
+
+_SYMBOL_REPLACEMENTS = _compose_symbol_map(SYMBOL_MAP)
+
+# All symbol keys in one alternation, longest first so multi-character keys
+# win over their prefixes
+_SYMBOL_RE = re.compile(
+    '|'.join(re.escape(key) for key in sorted(_SYMBOL_REPLACEMENTS, key=len, reverse=True))
+)
+
+# LaTeX notation replacements (LightOnOCR-2 outputs LaTeX for math symbols),
+# applied in order: dollar wrappers, then symbol commands, then the rest.
+# Patterns are compiled once at import.
+LATEX_WRAPPERS: List[Tuple[re.Pattern[str], str]] = [(re.compile(p), r) for p, r in [
     # Strip double dollar-sign wrappers first: $$...$$ -> ...
     (r'\$\$([^$]*)\$\$', r'\1'),
     # Strip single dollar-sign wrappers: $...$ -> ...
     (r'\$([^$]*)\$', r'\1'),
+]]
 
+# Symbol commands (pattern after the backslash -> symbol). All are replaced in
+# a single scan; every match starts at a backslash and no replacement contains
+# one, so this equals substituting them one at a time in this order.
+LATEX_SYMBOL_COMMANDS: List[Tuple[str, str]] = [
     # Diameter symbol variants -> ⌀ (U+2300)
     # \phi or \Phi -> ⌀
-    (r'\\[Pp]hi', '\u2300'),
+    (r'[Pp]hi', '\u2300'),
     # \varphi -> ⌀ (variant phi)
-    (r'\\varphi', '\u2300'),
+    (r'varphi', '\u2300'),
     # \varnothing -> ⌀ (empty set symbol, often misread as diameter)
-    (r'\\varnothing', '\u2300'),
-    (r'\\oslash', '\u2300'),
-    (r'\\emptyset', '\u2300'),
+    (r'varnothing', '\u2300'),
+    (r'oslash', '\u2300'),
+    (r'emptyset', '\u2300'),
     # \theta -> ⌀ (OCR misreads diameter as theta in engineering drawings)
-    (r'\\theta', '\u2300'),
+    (r'theta', '\u2300'),
     # \mathcal{O} or \mathcal{o} -> ⌀
-    (r'\\mathcal\{[Oo]\}', '\u2300'),
+    (r'mathcal\{[Oo]\}', '\u2300'),
     # \diameter -> ⌀
-    (r'\\diameter', '\u2300'),
+    (r'diameter', '\u2300'),
 
     # Plus-minus
     # \pm -> ±
-    (r'\\pm', '±'),
+    (r'pm', '±'),
 
     # Degree symbol variants
     # \degree or \deg -> °
-    (r'\\deg(?:ree)?', '°'),
+    (r'deg(?:ree)?', '°'),
     # \circ -> °
-    (r'\\circ', '°'),
+    (r'circ', '°'),
 
     # Multiplication
     # \times -> x
-    (r'\\times', 'x'),
+    (r'times', 'x'),
+]
+
+# One alternation behind the shared backslash (a literal prefix lets the
+# regex engine skip ahead to candidate positions), dispatched on group name
+_LATEX_SYMBOL_RE = re.compile(
+    r'\\(?:' + '|'.join(
+        f'(?P<s{i}>{command})' for i, (command, _) in enumerate(LATEX_SYMBOL_COMMANDS)
+    ) + ')'
+)
+_LATEX_SYMBOLS: Dict[str, str] = {
+    f's{i}': symbol for i, (_, symbol) in enumerate(LATEX_SYMBOL_COMMANDS)
+}
 
+LATEX_REPLACEMENTS: List[Tuple[re.Pattern[str], str]] = [(re.compile(p), r) for p, r in [
     # Subscript/superscript notation
     # Subscript: _{...} -> just the content (e.g., _{.75} -> .75)
     (r'_\{([^}]*)\}', r'\1'),
@@ -121,10 +168,10 @@ LATEX_REPLACEMENTS: List[Tuple[str, str]] = [
     # European comma-as-decimal in numbers: 1,5380 -> 1.5380
     # (only when between digits, no space after comma)
     (r'(\d),(\d)', r'\1.\2'),
-]
+]]
 
-# Regex-based replacements (applied after symbol map)
-REGEX_REPLACEMENTS: List[Tuple[str, str]] = [
+# Regex-based replacements (applied after symbol map, line by line)
+REGEX_REPLACEMENTS: List[Tuple[re.Pattern[str], str]] = [(re.compile(p, re.MULTILINE), r) for p, r in [
     # Collapse multiple spaces to single space
     (r'[ \t]+', ' '),
 
@@ -133,7 +180,20 @@ REGEX_REPLACEMENTS: List[Tuple[str, str]] = [
 
     # Remove leading/trailing whitespace per line
     (r'^\s+|\s+$', ''),
-]
+]]
+
+# Diameter symbol directly followed by 2-3 digits with no decimal point
+_LEADING_DECIMAL_RE = re.compile(r'([\u2300])\s*(\d{2,3})(?![\d./])')
+
+
+def _latex_symbol(match: re.Match[str]) -> str:
+    """Replacement for a _LATEX_SYMBOL_RE match."""
+    return _LATEX_SYMBOLS[match.lastgroup]
+
+
+def _symbol(match: re.Match[str]) -> str:
+    """Replacement for a _SYMBOL_RE match."""
+    return _SYMBOL_REPLACEMENTS[match.group()]
 
 
 def _repair_missing_leading_decimals(text: str) -> str:
@@ -153,9 +213,10 @@ def _repair_missing_leading_decimals(text: str) -> str:
         digits = match.group(2)
         return f"{symbol}.{digits}"
 
-    return re.sub(r'([\u2300])\s*(\d{2,3})(?![\d./])', repl, text)
+    return _LEADING_DECIMAL_RE.sub(repl, text)
 
 
+@lru_cache(maxsize=4096)
 def canonicalize(text: str) -> str:
     """
     Canonicalize OCR text for consistent downstream parsing.
@@ -171,23 +232,32 @@ def canonicalize(text: str) -> str:
 
     Returns:
         Canonicalized text with normalized symbols and whitespace
+
+    Results are memoized: the same callout text recurs across crops, views
+    and pages. Use canonicalize.cache_clear() to reset.
     """
     if not text:
         return ""
 
     result = text
 
-    # Step 0: LaTeX cleanup (LightOnOCR-2 outputs LaTeX notation)
-    for pattern, replacement in LATEX_REPLACEMENTS:
-        result = re.sub(pattern, replacement, result)
+    # Step 0: LaTeX cleanup (LightOnOCR-2 outputs LaTeX notation).
+    # Every LaTeX pattern needs one of these characters to match, so plain
+    # OCR text skips the whole step.
+    if "\\" in result or "$" in result or "{" in result or "," in result:
+        for pattern, replacement in LATEX_WRAPPERS:
+            result = pattern.sub(replacement, result)
+        result = _LATEX_SYMBOL_RE.sub(_latex_symbol, result)
+        for pattern, replacement in LATEX_REPLACEMENTS:
+            result = pattern.sub(replacement, result)
 
-    # Step 1: Symbol map replacements
-    for old, new in SYMBOL_MAP.items():
-        result = result.replace(old, new)
+    # Step 1: Symbol map replacements (the only ASCII keys contain "/")
+    if not result.isascii() or "/" in result:
+        result = _SYMBOL_RE.sub(_symbol, result)
 
     # Step 2: Regex replacements
     for pattern, replacement in REGEX_REPLACEMENTS:
-        result = re.sub(pattern, replacement, result, flags=re.MULTILINE)
+        result = pattern.sub(replacement, result)
 
     # Step 3: Numeric OCR repairs
     result = _repair_missing_leading_decimals(result)
@@ -208,9 +278,4 @@ def canonicalize_lines(lines: List[str]) -> List[str]:
     Returns:
         List of canonicalized lines (empty lines removed)
     """
-    result = []
-    for line in lines:
-        canon = canonicalize(line)
-        if canon:
-            result.append(canon)
-    return result
+    return [canon for canon in map(canonicalize, lines) if canon]
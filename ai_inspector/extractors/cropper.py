@@ -1,7 +1,7 @@
 """OBB cropper with padding and minimum crop constraints."""
 
 import math
-from typing import List
+from typing import List, Union
 
 import numpy as np
 from PIL import Image
@@ -48,7 +48,7 @@ def compute_obb_angle(pts: np.ndarray) -> float:
 
 def crop_obb(
     image: Image.Image,
-    obb_points: List[List[float]],
+    obb_points: Union[np.ndarray, List[List[float]]],
     pad_ratio: float = 0.15,
     min_width: int = MIN_CROP_WIDTH,
     min_height: int = MIN_CROP_HEIGHT,
@@ -68,7 +68,7 @@ def crop_obb(
 
     Args:
         image: Source PIL Image
-        obb_points: 4 corner points [[x,y], ...]
+        obb_points: 4 corner points [[x,y], ...] (array or nested lists)
         pad_ratio: Padding ratio (0.15 = 15% on each side)
         min_width: Minimum crop width in pixels
         min_height: Minimum crop height in pixels
@@ -77,7 +77,7 @@ def crop_obb(
     Returns:
         CropResult with cropped image and metadata
     """
-    pts = np.array(obb_points, dtype=np.float32)
+    pts = np.asarray(obb_points, dtype=np.float32)
     ordered = order_points(pts)
 
     # Compute rotation angle
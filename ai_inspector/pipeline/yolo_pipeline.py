@@ -98,21 +98,6 @@ class YOLOPipeline:
     def is_loaded(self) -> bool:
         return self._matcher is not None
 
-    def _apply_class_confidence_thresholds(self, detections: List[Any]) -> List[Any]:
-        """Post-filter detections using class-specific confidence thresholds."""
-        thresholds = getattr(self.config, "yolo_class_confidence_thresholds", {}) or {}
-        if not thresholds:
-            return detections
-
-        filtered = []
-        for det in detections:
-            class_name = getattr(det, "class_name", "")
-            conf = float(getattr(det, "confidence", 0.0))
-            min_conf = thresholds.get(class_name)
-            if min_conf is None or conf >= float(min_conf):
-                filtered.append(det)
-        return filtered
-
     def run(
         self,
         image_path: Optional[str] = None,
@@ -185,10 +170,15 @@ class YOLOPipeline:
             confidence_threshold=self.confidence_threshold,
             device=self.device,
             hf_token=self.hf_token,
+            precision=self.config.yolo_precision,
+            calibration_data=self.config.yolo_calibration_data,
         )
         detector.load()
-        detections = detector.detect(image, page_id=page_id)
-        detections = self._apply_class_confidence_thresholds(detections)
+        detections = detector.detect(
+            image,
+            page_id=page_id,
+            class_thresholds=getattr(self.config, "yolo_class_confidence_thresholds", None),
+        )
         detector.unload()
         del detector
 
@@ -107,8 +107,8 @@ def packet_to_dict(packet: CalloutPacket) -> Dict[str, Any]:
         d["detection"] = {
             "class_name": packet.detection.class_name,
             "confidence": packet.detection.confidence,
-            "obb_points": packet.detection.obb_points,
-            "xywhr": packet.detection.xywhr,
+            "obb_points": packet.detection.obb_points_as_list(),
+            "xywhr": packet.detection.xywhr_as_list(),
             "det_id": packet.detection.det_id,
         }
 
@@ -4,5 +4,5 @@ setup(
     name="ai_inspector",
     version="4.0.0",
     packages=find_packages(),
-    python_requires=">=3.9",
+    python_requires=">=3.10",
 )
@@ -0,0 +1,27 @@
+"""Tests for formatting match results into diff entries."""
+
+from ai_inspector.comparison.diff_result import _fmt_drawing_default, _match_result_to_entry
+from ai_inspector.comparison.matcher import MatchResult, MatchStatus
+from ai_inspector.comparison.sw_extractor import SwFeature
+
+
+def _entry(callout=None, feature=None):
+    return _match_result_to_entry(
+        MatchResult(status=MatchStatus.MATCHED, drawing_callout=callout, sw_feature=feature)
+    )
+
+
+class TestValueFormatting:
+    def test_null_thread_falls_back_to_diameter(self):
+        """VLM JSON may carry "thread": null on a callout without raw text."""
+        assert _fmt_drawing_default({"thread": None, "diameter": 0.25}) == '0.2500"'
+        entry = _entry({"calloutType": "TappedHole", "thread": None, "diameter": 0.25})
+        assert entry.drawing_value == '0.2500"'
+
+    def test_value_comes_from_present_field_not_type(self):
+        entry = _entry(
+            {"calloutType": "Hole", "thread": {"fraction": "1/4", "tpi": 20}, "diameter": 0.25},
+            SwFeature(feature_type="Fillet", diameter_inches=0.5),
+        )
+        assert entry.drawing_value == "1/4-20"
+        assert entry.sw_value == '0.5000"'
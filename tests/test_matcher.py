@@ -0,0 +1,69 @@
+"""Tests for drawing callout vs SolidWorks feature matching."""
+
+from ai_inspector.comparison.matcher import FeatureMatcher, MatchStatus
+from ai_inspector.comparison.sw_extractor import SwFeature
+
+
+def _hole(dia, **kw):
+    return {"calloutType": "Hole", "diameter": dia, **kw}
+
+
+def _sw_hole(dia, **kw):
+    return SwFeature(feature_type="Hole", diameter_inches=dia, **kw)
+
+
+class TestAssignment:
+    def test_optimal_assignment_beats_greedy(self):
+        """A greedy first pick would push the second hole out of tolerance."""
+        callouts = [_hole(0.505), _hole(0.492)]
+        sw = [_sw_hole(0.500), _sw_hole(0.515)]
+
+        results = FeatureMatcher().match_all(callouts, sw)
+
+        statuses = [r.status for r in results]
+        assert statuses == [MatchStatus.MATCHED, MatchStatus.MATCHED]
+        pairs = {r.drawing_callout["diameter"]: r.sw_feature.diameter_inches for r in results}
+        assert pairs == {0.505: 0.515, 0.492: 0.500}
+
+    def test_tolerance_fail_only_when_nothing_in_tolerance(self):
+        callouts = [_hole(0.500), _hole(0.530)]
+        sw = [_sw_hole(0.501), _sw_hole(0.505)]
+
+        results = FeatureMatcher().match_all(callouts, sw)
+
+        by_status = {}
+        for r in results:
+            by_status.setdefault(r.status, []).append(r)
+        assert len(by_status[MatchStatus.MATCHED]) == 1
+        assert len(by_status[MatchStatus.TOLERANCE_FAIL]) == 1
+        assert by_status[MatchStatus.TOLERANCE_FAIL][0].drawing_callout["diameter"] == 0.530
+
+    def test_tolerance_fails_do_not_displace_a_match(self):
+        """Two TOLERANCE_FAIL pairs must not be preferred over one real match."""
+        callouts = [_hole(0.500), _hole(0.460)]
+        sw = [_sw_hole(0.500), _sw_hole(0.530)]
+
+        results = FeatureMatcher().match_all(callouts, sw)
+
+        outcome = sorted(
+            (
+                r.status.value,
+                r.drawing_callout["diameter"] if r.drawing_callout else None,
+                r.sw_feature.diameter_inches if r.sw_feature else None,
+            )
+            for r in results
+        )
+        assert outcome == [
+            ("extra", 0.460, None),
+            ("matched", 0.500, 0.500),
+            ("missing", None, 0.530),
+        ]
+
+    def test_unmatched_sides_reported(self):
+        callouts = [_hole(0.250), {"calloutType": "Slot", "raw": "SLOT"}]
+        sw = [_sw_hole(0.750)]
+
+        results = FeatureMatcher().match_all(callouts, sw)
+
+        statuses = sorted(r.status.value for r in results)
+        assert statuses == ["extra", "missing", "skipped"]